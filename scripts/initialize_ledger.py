@@ -9,7 +9,6 @@ import sys
 import json
 import logging
 import argparse
-import sqlite3
 from pathlib import Path
 
 # Add the project root to the Python path
@@ -19,6 +18,7 @@ sys.path.insert(0, str(project_root))
 
 from fontana.core.models.utxo import UTXO
 from fontana.core.db import db
+from fontana.core.db.connect import connect
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -39,7 +39,7 @@ def init_db_tables(db_path):
     # Make sure the parent directory exists
     os.makedirs(os.path.dirname(db_path), exist_ok=True)
     
-    with sqlite3.connect(db_path) as conn:
+    with connect(db_path) as conn:
         cur = conn.cursor()
         
         # Create UTXOs table - EXACT MATCH with db.py
@@ -146,7 +146,7 @@ def initialize_ledger(genesis_file, force=False, db_path=None):
             genesis_data = json.load(f)
         
         # Process initial UTXOs
-        with sqlite3.connect(db_path) as conn:
+        with connect(db_path) as conn:
             cur = conn.cursor()
             
             # Check if genesis has 'allocations' format
@@ -10,10 +10,10 @@ import os
 import time
 import logging
 import threading
-import sqlite3
 from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
+from fontana.core.db.connect import connect
 from fontana.core.ledger.ledger import Ledger
 from fontana.bridge.handler import handle_deposit_received
 from fontana.bridge.celestia.account_client import CelestiaAccountClient
@@ -25,6 +25,15 @@ logger = logging.getLogger("vault_watcher")
 # Default DB file location
 DEFAULT_DB_PATH = "vault_watcher.db"
 
+# SQLite's default limit on bound parameters per statement
+_MAX_SQL_VARIABLES = 999
+
+_INSERT_DEPOSIT_SQL = """
+    INSERT INTO vault_deposits
+    (l1_tx_hash, recipient_address, amount, l1_block_height, l1_block_time, processed_time)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
 
 class VaultWatcher:
     """
@@ -60,6 +69,10 @@ class VaultWatcher:
         self.is_running = False
         self.monitor_thread = None
 
+        # One connection shared by the monitor thread and callers, guarded by a lock
+        self._db = connect(db_path, check_same_thread=False)
+        self._db_lock = threading.Lock()
+
         # Initialize database
         self._init_db()
 
@@ -78,7 +91,7 @@ class VaultWatcher:
     def _init_db(self):
         """Initialize the SQLite database with required tables."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._db_lock, self._db as conn:
                 cursor = conn.cursor()
                 
                 # Create table for tracking processed deposits
@@ -115,7 +128,7 @@ class VaultWatcher:
             int: The last processed block height, or 0 if none found
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._db_lock, self._db as conn:
                 cursor = conn.cursor()
                 cursor.execute("SELECT value FROM system_vars WHERE key = 'last_l1_height_processed'")
                 result = cursor.fetchone()
@@ -141,7 +154,7 @@ class VaultWatcher:
             height: The new block height to record
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._db_lock, self._db as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     "UPDATE system_vars SET value = ? WHERE key = 'last_l1_height_processed'",
@@ -211,7 +224,7 @@ class VaultWatcher:
             bool: True if already processed, False otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._db_lock, self._db as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     "SELECT COUNT(*) FROM vault_deposits WHERE l1_tx_hash = ?",
@@ -223,6 +236,44 @@ class VaultWatcher:
             logger.error(f"Error checking if deposit is processed: {str(e)}")
             return False
 
+    def _filter_unprocessed(self, deposits: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Drop deposits that have already been processed.
+        
+        Looks up all tx hashes in one query per chunk instead of one query
+        per deposit. Repeats of the same tx hash within the batch are dropped too.
+        
+        Args:
+            deposits: Deposit details
+            
+        Returns:
+            List[Dict[str, Any]]: The deposits not yet recorded, in their original order
+        """
+        tx_hashes = list(dict.fromkeys(d["l1_tx_hash"] for d in deposits))
+        seen = set()
+        try:
+            with self._db_lock, self._db as conn:
+                for i in range(0, len(tx_hashes), _MAX_SQL_VARIABLES):
+                    chunk = tx_hashes[i:i + _MAX_SQL_VARIABLES]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = conn.execute(
+                        f"SELECT l1_tx_hash FROM vault_deposits WHERE l1_tx_hash IN ({placeholders})",
+                        chunk
+                    ).fetchall()
+                    seen.update(row[0] for row in rows)
+        except Exception as e:
+            logger.error(f"Error checking processed deposits: {str(e)}")
+        
+        unprocessed = []
+        for deposit in deposits:
+            tx_hash = deposit["l1_tx_hash"]
+            if tx_hash in seen:
+                logger.info(f"Deposit {tx_hash} already processed, skipping")
+                continue
+            seen.add(tx_hash)
+            unprocessed.append(deposit)
+        return unprocessed
+
     def _record_deposit(self, deposit: Dict[str, Any]) -> bool:
         """
         Record a processed deposit in the database.
@@ -233,28 +284,36 @@ class VaultWatcher:
         Returns:
             bool: True if successful, False otherwise
         """
+        return self._record_deposits([deposit])
+
+    def _record_deposits(self, deposits: List[Dict[str, Any]]) -> bool:
+        """
+        Record a batch of processed deposits in a single transaction.
+        
+        Args:
+            deposits: Deposit details
+            
+        Returns:
+            bool: True if all deposits were recorded, False otherwise
+        """
+        processed_time = int(time.time())
+        rows = [
+            (
+                deposit["l1_tx_hash"],
+                deposit["recipient_address"],
+                deposit["amount"],
+                deposit["l1_block_height"],
+                deposit["l1_block_time"],
+                processed_time
+            )
+            for deposit in deposits
+        ]
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    INSERT INTO vault_deposits 
-                    (l1_tx_hash, recipient_address, amount, l1_block_height, l1_block_time, processed_time) 
-                    VALUES (?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        deposit["l1_tx_hash"],
-                        deposit["recipient_address"],
-                        deposit["amount"],
-                        deposit["l1_block_height"],
-                        deposit["l1_block_time"],
-                        int(time.time())
-                    )
-                )
-                conn.commit()
-                return True
+            with self._db_lock, self._db as conn:
+                conn.executemany(_INSERT_DEPOSIT_SQL, rows)
+            return True
         except Exception as e:
-            logger.error(f"Error recording deposit: {str(e)}")
+            logger.error(f"Error recording deposits: {str(e)}")
             return False
 
     def _process_deposit(self, deposit: Dict[str, Any]) -> bool:
@@ -262,7 +321,7 @@ class VaultWatcher:
         Process a new deposit.
         
         This checks if the deposit has already been processed,
-        records it in the database, and forwards it to the bridge handler.
+        forwards it to the bridge handler, and records it in the database.
         
         Args:
             deposit: Deposit details
@@ -270,28 +329,48 @@ class VaultWatcher:
         Returns:
             bool: True if processing was successful, False otherwise
         """
-        tx_hash = deposit["l1_tx_hash"]
+        return self._process_deposits([deposit])[0]
+
+    def _process_deposits(self, deposits: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Process a batch of deposits.
         
-        # Check if already processed
-        if self._is_deposit_processed(tx_hash):
-            logger.info(f"Deposit {tx_hash} already processed, skipping")
-            return True
+        Deposits that have not been seen before are forwarded to the bridge
+        handler one by one. The ones the handler accepted are then recorded
+        with one INSERT per row inside a single transaction; the rest stay
+        unrecorded so a later pass retries them.
         
-        # Record the deposit in the database
-        if not self._record_deposit(deposit):
-            logger.error(f"Failed to record deposit {tx_hash}")
-            return False
+        Args:
+            deposits: Deposit details, in L1 order
+            
+        Returns:
+            List[bool]: Whether each deposit was processed successfully
+        """
+        new_deposits = {d["l1_tx_hash"]: d for d in self._filter_unprocessed(deposits)}
+        
+        if not new_deposits:
+            return [True] * len(deposits)
         
         # Forward to bridge handler
-        logger.info(f"Processing deposit: {deposit}")
-        result = handle_deposit_received(deposit, self.ledger)
+        results: Dict[str, bool] = {}
+        for tx_hash, deposit in new_deposits.items():
+            logger.info(f"Processing deposit: {deposit}")
+            result = handle_deposit_received(deposit, self.ledger)
+            
+            if result:
+                logger.info(f"Successfully processed deposit {tx_hash}")
+            else:
+                logger.error(f"Failed to process deposit {tx_hash} through bridge handler")
+            results[tx_hash] = result
         
-        if result:
-            logger.info(f"Successfully processed deposit {tx_hash}")
-        else:
-            logger.error(f"Failed to process deposit {tx_hash} through bridge handler")
+        # Record the forwarded deposits in the database
+        forwarded = [new_deposits[tx_hash] for tx_hash, ok in results.items() if ok]
+        if forwarded and not self._record_deposits(forwarded):
+            logger.error(f"Failed to record {len(forwarded)} deposits")
+            for deposit in forwarded:
+                results[deposit["l1_tx_hash"]] = False
         
-        return result
+        return [results.get(d["l1_tx_hash"], True) for d in deposits]
 
     def _run_loop(self):
         """Main monitoring loop that runs in a separate thread."""
@@ -320,9 +399,14 @@ class VaultWatcher:
                 if deposits:
                     logger.info(f"Found {len(deposits)} new deposits")
                     
-                    # Process each deposit
-                    for deposit in deposits:
-                        self._process_deposit(deposit)
+                    if not all(self._process_deposits(deposits)):
+                        # Leave the height alone so the next pass retries the
+                        # range; recorded deposits are skipped then
+                        logger.warning(
+                            f"Some deposits up to block {end_height} failed, retrying the range"
+                        )
+                        time.sleep(self.poll_interval)
+                        continue
                 
                 # Update the last processed height
                 self._update_last_processed_height(end_height)
@@ -357,6 +441,14 @@ class VaultWatcher:
             self.monitor_thread = None
         logger.info("Vault watcher stopped")
 
+    def close(self):
+        """Close the database connection.
+
+        Call once the watcher is done for good; it cannot be restarted after.
+        """
+        with self._db_lock:
+            self._db.close()
+
 
 def main():
     """Main entry point for the vault watcher daemon."""
@@ -396,6 +488,7 @@ def main():
         except KeyboardInterrupt:
             logger.info("Shutting down vault watcher...")
             watcher.stop()
+            watcher.close()
             
     except Exception as e:
         logger.error(f"Error running vault watcher: {str(e)}")
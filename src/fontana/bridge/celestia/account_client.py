@@ -38,13 +38,19 @@ class CelestiaAccountClient:
     retrieving balances, and querying transactions.
     """
 
-    def __init__(self, node_url: str, chain_id: str = "celestia"):
+    def __init__(
+        self,
+        node_url: str,
+        chain_id: str = "celestia",
+        client: Optional[LedgerClient] = None,
+    ):
         """
         Initialize the client.
 
         Args:
             node_url: URL of the Celestia REST API
             chain_id: Chain ID of the Celestia network
+            client: Ledger client to use instead of creating one (e.g. in tests)
         """
         self.chain_id = chain_id
 
@@ -70,8 +76,11 @@ class CelestiaAccountClient:
             staking_denomination="utia",
         )
 
-        # Initialize the ledger client
-        self._initialize_client()
+        # Initialize the ledger client, unless one was supplied
+        if client is None:
+            self._initialize_client()
+        else:
+            self.client = client
         logger.info(f"Connected to Celestia node at {node_url}")
 
     def _initialize_client(self):
@@ -121,6 +130,7 @@ class CelestiaAccountClient:
         limit: int = 20,
         offset: int = 0,
         min_height: Optional[int] = None,
+        max_height: Optional[int] = None,
     ) -> List[CelestiaTransaction]:
         """
         Get transactions involving a Celestia account.
@@ -130,6 +140,7 @@ class CelestiaAccountClient:
             limit: Maximum number of transactions to return
             offset: Offset for pagination
             min_height: Minimum block height to query from
+            max_height: Maximum block height to query up to
 
         Returns:
             List[CelestiaTransaction]: List of transactions formatted as CelestiaTransaction objects
@@ -145,6 +156,8 @@ class CelestiaAccountClient:
             query_path = f"/cosmos/tx/v1beta1/txs?events={','.join(query_events)}&pagination.limit={limit}"
             if min_height is not None:
                 query_path += f"&events=tx.height>={min_height}"
+            if max_height is not None:
+                query_path += f"&events=tx.height<={max_height}"
 
             response = self.client.query(query_path)
             txs = response.get("tx_responses", [])
@@ -214,9 +227,10 @@ class CelestiaAccountClient:
             f"Checking for deposits to {vault_address} from height {from_height} to {to_height}"
         )
 
-        # Get transactions for the vault address
+        # Get transactions for the vault address, bounded on both ends so the
+        # node doesn't send back blocks we would discard anyway
         txs = self.get_account_transactions(
-            vault_address, limit=limit, min_height=from_height
+            vault_address, limit=limit, min_height=from_height, max_height=to_height
         )
 
         # Filter for deposits within the height range
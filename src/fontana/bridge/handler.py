@@ -6,6 +6,7 @@ connecting external components (like the vault watcher or Rust bridge) to the co
 """
 
 import logging
+from operator import itemgetter
 from typing import Dict, Any, Optional, List, Callable
 
 from fontana.core.ledger.ledger import Ledger
@@ -15,6 +16,18 @@ from fontana.core.notifications import NotificationType
 # Set up logger
 logger = logging.getLogger(__name__)
 
+# Fields each L1 event must carry before it is forwarded to the ledger
+_REQUIRED_DEPOSIT_FIELDS = frozenset(
+    {"l1_tx_hash", "recipient_address", "amount", "l1_block_height"}
+)
+_REQUIRED_WITHDRAWAL_FIELDS = frozenset(
+    {"l1_tx_hash", "rollup_tx_hash", "amount", "l1_block_height"}
+)
+
+# Fields copied into the notification payloads
+_deposit_fields = itemgetter("l1_tx_hash", "recipient_address", "amount")
+_withdrawal_fields = itemgetter("l1_tx_hash", "rollup_tx_hash", "amount")
+
 
 def handle_deposit_received(deposit_details: Dict[str, Any], ledger: Ledger) -> bool:
     """
@@ -39,11 +52,10 @@ def handle_deposit_received(deposit_details: Dict[str, Any], ledger: Ledger) ->
     logger.info(f"Processing deposit: {deposit_details}")
 
     # Validate required fields
-    required_fields = ["l1_tx_hash", "recipient_address", "amount", "l1_block_height"]
-    for field in required_fields:
-        if field not in deposit_details:
-            logger.error(f"Missing required field in deposit: {field}")
-            return False
+    missing = _REQUIRED_DEPOSIT_FIELDS - deposit_details.keys()
+    if missing:
+        logger.error(f"Missing required field in deposit: {', '.join(sorted(missing))}")
+        return False
 
     # Process deposit in ledger
     try:
@@ -53,10 +65,11 @@ def handle_deposit_received(deposit_details: Dict[str, Any], ledger: Ledger) ->
             # Send notification
             try:
                 # Create notification data
+                tx_hash, recipient, amount = _deposit_fields(deposit_details)
                 notification_data = {
-                    "tx_hash": deposit_details["l1_tx_hash"],
-                    "recipient": deposit_details["recipient_address"],
-                    "amount": deposit_details["amount"],
+                    "tx_hash": tx_hash,
+                    "recipient": recipient,
+                    "amount": amount,
                 }
 
                 # Send the notification
@@ -98,11 +111,12 @@ def handle_withdrawal_confirmed(
     logger.info(f"Processing withdrawal confirmation: {withdrawal_details}")
 
     # Validate required fields
-    required_fields = ["l1_tx_hash", "rollup_tx_hash", "amount", "l1_block_height"]
-    for field in required_fields:
-        if field not in withdrawal_details:
-            logger.error(f"Missing required field in withdrawal: {field}")
-            return False
+    missing = _REQUIRED_WITHDRAWAL_FIELDS - withdrawal_details.keys()
+    if missing:
+        logger.error(
+            f"Missing required field in withdrawal: {', '.join(sorted(missing))}"
+        )
+        return False
 
     # Process withdrawal in ledger
     try:
@@ -112,10 +126,11 @@ def handle_withdrawal_confirmed(
             # Send notification
             try:
                 # Create notification data
+                tx_hash, rollup_tx_hash, amount = _withdrawal_fields(withdrawal_details)
                 notification_data = {
-                    "tx_hash": withdrawal_details["l1_tx_hash"],
-                    "rollup_tx_hash": withdrawal_details["rollup_tx_hash"],
-                    "amount": withdrawal_details["amount"],
+                    "tx_hash": tx_hash,
+                    "rollup_tx_hash": rollup_tx_hash,
+                    "amount": amount,
                 }
 
                 # Send the notification
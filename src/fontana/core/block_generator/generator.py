@@ -9,8 +9,14 @@ import threading
 import logging
 import hashlib
 import json
+from functools import partial
 from typing import List, Optional
 
+try:
+    import blake3
+except ImportError:  # blake3 is only needed when configured for header hashing
+    blake3 = None
+
 from fontana.core.config import config
 from fontana.core.db import db
 from fontana.core.models.block import Block, BlockHeader
@@ -54,17 +60,39 @@ class BlockGenerator:
         self.celestia_client = celestia_client
         self.is_running = False
         self.thread = None
-        self.block_interval = config.block_interval_seconds
-        self.max_block_size = config.max_block_transactions
+        self.reload_config()
+        
+        # Lets the generation loop sleep until transactions arrive
+        self._wake = threading.Condition()
+        self.processor.add_pending_listener(self.wake)
         
         # Batch transaction detection and handling
         self.batch_mode_detected = False
-        self.batch_start_time = None
+        self.batch_start_ns = None  # time.monotonic_ns() when batch mode was detected
         self.batch_collection_timeout = 3.0  # Wait 3 seconds after detecting first batch transaction
         
         logger.info(f"Block generator initialized with interval={self.block_interval}s, "
                    f"max_block_size={self.max_block_size}")
     
+    def reload_config(self) -> None:
+        """Snapshot the config values used on the block generation path.
+        
+        Call this again after changing the config to pick up new values.
+        """
+        self.block_interval = config.block_interval_seconds
+        self._block_interval_ns = int(self.block_interval * 1_000_000_000)
+        self.max_block_size = config.max_block_transactions
+        self._fee_schedule_id = str(config.fee_schedule_id)
+        self._block_hash_algorithm = config.block_hash_algorithm
+        
+        # Header constructor with the per-node constant fields bound
+        self._make_header = partial(
+            BlockHeader,
+            # For now, we'll use empty values for these fields
+            blob_ref="",
+            fee_schedule_id=self._fee_schedule_id
+        )
+    
     def create_block_header(self, height: int, prev_hash: str, state_root: str, 
                            transactions: List[SignedTransaction]) -> BlockHeader:
         """Create a new block header.
@@ -82,25 +110,40 @@ class BlockGenerator:
         timestamp = int(time.time())
         
         # Create header
-        header = BlockHeader(
+        header = self._make_header(
             height=height,
             prev_hash=prev_hash,
             state_root=state_root,
             timestamp=timestamp,
-            tx_count=len(transactions),
-            # For now, we'll use empty values for these fields
-            blob_ref="",
-            fee_schedule_id=str(config.fee_schedule_id)
+            tx_count=len(transactions)
         )
         
         # Calculate header hash
         header_dict = header.model_dump()
         header_dict.pop("hash", None)  # Exclude hash field if present
         header_json = json.dumps(header_dict, sort_keys=True)
-        header.hash = hashlib.sha256(header_json.encode()).hexdigest()
+        header.hash = self._hash_header(header_json.encode())
         
         return header
     
+    def _hash_header(self, data: bytes) -> str:
+        """Hash canonical header bytes with the configured algorithm.
+        
+        Args:
+            data: Canonical JSON encoding of the header
+            
+        Returns:
+            str: Hex digest of the header
+        """
+        if self._block_hash_algorithm == "blake3":
+            if blake3 is None:
+                raise BlockGenerationError(
+                    "block_hash_algorithm is 'blake3' but the blake3 package is not installed"
+                )
+            return blake3.blake3(data).hexdigest()
+        
+        return hashlib.sha256(data).hexdigest()
+    
     def _sort_transactions_topologically(self, transactions: List[SignedTransaction]) -> List[SignedTransaction]:
         """Sort transactions topologically to ensure dependent transactions are processed in the right order.
         
@@ -190,6 +233,9 @@ class BlockGenerator:
         Returns:
             Optional[Block]: The generated block, or None if no transactions
         """
+        # Drained transactions that are not yet in a saved block; they go
+        # back on the queue if generation fails part way through
+        uncommitted = []
         try:
             logger.info("=== Attempting to generate a new block ===")
             # Get latest block from DB
@@ -225,8 +271,10 @@ class BlockGenerator:
             except Exception as e:
                 logger.error(f"Error checking database transactions: {str(e)}")
             
-            # Get pending transactions with transaction processor helper
-            pending_txs = self.processor.get_pending_transactions(limit=self.max_block_size)
+            # Take pending transactions off the queue; anything not included
+            # in the block is requeued below
+            pending_txs = self.processor.drain_pending(self.max_block_size)
+            uncommitted = pending_txs
             
             # If there are no pending transactions, return None
             if not pending_txs:
@@ -259,29 +307,47 @@ class BlockGenerator:
                 for i, tx in enumerate(sorted_txs):
                     logger.info(f"  {i+1}. {tx.txid[:8]}...")
             
-            for tx in sorted_txs:
-                try:
-                    # Apply transaction to update state
-                    if self.ledger.apply_transaction(tx):
-                        applied_txs.append(tx)
-                        applied_tx_ids.append(tx.txid)
-                        logger.debug(f"Successfully applied transaction {tx.txid[:8]}...")
-                        
-                        # Send notification that transaction was included
-                        if self.notification_manager:
-                            self.notification_manager.notify(
-                                NotificationType.TRANSACTION_INCLUDED,
-                                {
-                                    "txid": tx.txid,
-                                    "block_height": height,
-                                    "sender": tx.sender_address,
-                                    "status": "applied"
-                                }
-                            )
-                    else:
-                        logger.warning(f"Failed to apply transaction {tx.txid}")
-                except Exception as e:
-                    logger.error(f"Error applying transaction {tx.txid}: {str(e)}")
+            # Verify all signatures up front, in parallel across cores, and
+            # drop failures before touching the ledger
+            verified_txs = self.processor.verify_pending(sorted_txs)
+            # Transactions with bad signatures were rejected for good
+            uncommitted = verified_txs
+            
+            # Apply the whole batch to the ledger in one database transaction
+            try:
+                applied_mask = self.ledger.apply_transactions(verified_txs, signatures_verified=True)
+            except Exception as e:
+                logger.error(f"Error applying transactions: {str(e)}")
+                applied_mask = [False] * len(verified_txs)
+            
+            notification_manager = self.notification_manager
+            failed_txs = []
+            
+            for tx, applied in zip(verified_txs, applied_mask):
+                if not applied:
+                    logger.warning(f"Failed to apply transaction {tx.txid}")
+                    failed_txs.append(tx)
+                    continue
+                
+                applied_txs.append(tx)
+                applied_tx_ids.append(tx.txid)
+                logger.debug("Successfully applied transaction %s...", tx.txid[:8])
+                
+                # Send notification that transaction was included
+                if notification_manager:
+                    notification_manager.notify(
+                        NotificationType.TRANSACTION_INCLUDED,
+                        {
+                            "txid": tx.txid,
+                            "block_height": height,
+                            "sender": tx.sender_address,
+                            "status": "applied"
+                        }
+                    )
+            
+            # Keep failed transactions queued so a later block can retry them
+            self.processor.requeue(failed_txs)
+            uncommitted = applied_txs
             
             # If no transactions were applied, return None
             if not applied_txs:
@@ -304,15 +370,20 @@ class BlockGenerator:
             
             # Persist block to database
             try:
-                # Use save_block instead of insert_block for consistency
-                # save_block also handles marking transactions as committed
-                db.save_block(block)
+                # save_blocks also marks the transactions as committed,
+                # in the same database transaction
+                if not db.save_blocks([block]):
+                    raise RuntimeError("block was not written")
+                uncommitted = []
                 
                 # Clear processed transactions
                 self.processor.clear_processed_transactions(applied_tx_ids)
             except Exception as e:
                 logger.error(f"Error saving block {block.header.height} to database: {str(e)}")
-                # We still want to continue with the rest of the process even if saving fails
+                # Put the transactions back so a later block can include them,
+                # but continue with the rest of the process
+                self.processor.requeue(uncommitted)
+                uncommitted = []
             
             # Send notification that block was created
             if self.notification_manager:
@@ -344,6 +415,7 @@ class BlockGenerator:
             
         except Exception as e:
             logger.error(f"Error generating block: {str(e)}")
+            self.processor.requeue(uncommitted)
             raise BlockGenerationError(f"Failed to generate block: {str(e)}")
     
     def _is_batch_transaction(self, tx) -> bool:
@@ -374,6 +446,20 @@ class BlockGenerator:
         # it's probably part of a batch
         return len(recent_txs_from_sender) > 1
     
+    def wake(self) -> None:
+        """Wake the block generation loop early, e.g. when a transaction is queued."""
+        with self._wake:
+            self._wake.notify_all()
+    
+    def _wait(self, timeout: float) -> None:
+        """Sleep for up to timeout seconds, returning early if woken.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+        """
+        with self._wake:
+            self._wake.wait(timeout)
+    
     def _block_generation_loop(self) -> None:
         """Main block generation loop for batched transaction processing.
         
@@ -384,14 +470,16 @@ class BlockGenerator:
         logger.info(f"Fast transaction batching system started - CLI responds <100ms, batching every {self.block_interval}s")
         logger.info(f"Using max_block_size of {self.max_block_size} transactions per block")
         
-        # Set initial last batch time
-        self.last_batch_time = time.time()
+        # Set initial last batch time; the loop measures intervals in integer
+        # nanoseconds on the monotonic clock so wall-clock jumps can't stall it
+        self.last_batch_ns = time.monotonic_ns()
+        batch_collection_timeout_ns = int(self.batch_collection_timeout * 1_000_000_000)
         
         while self.is_running:
             try:
                 # Check if it's time to generate a new block
-                current_time = time.time()
-                time_since_last_batch = current_time - self.last_batch_time
+                now_ns = time.monotonic_ns()
+                ns_since_last_batch = now_ns - self.last_batch_ns
                 
                 # Get transaction stats from processor
                 tx_stats = self.processor.get_transaction_stats()
@@ -411,58 +499,58 @@ class BlockGenerator:
                             if not self.batch_mode_detected:
                                 # First time detecting batch mode in this session
                                 self.batch_mode_detected = True
-                                self.batch_start_time = current_time
+                                self.batch_start_ns = now_ns
                                 logger.info(f"🔍 Batch transaction pattern detected! Waiting for more transactions to accumulate")
                             break
                     
                     # If we're in batch mode and it hasn't expired yet, wait longer
                     if self.batch_mode_detected:
-                        batch_wait_time = current_time - self.batch_start_time
-                        if batch_wait_time < self.batch_collection_timeout:
-                            logger.info(f"⏳ In batch collection mode, waiting for more transactions. Time elapsed: {batch_wait_time:.2f}s/{self.batch_collection_timeout:.2f}s")
+                        batch_wait_ns = now_ns - self.batch_start_ns
+                        if batch_wait_ns < batch_collection_timeout_ns:
+                            logger.info(f"⏳ In batch collection mode, waiting for more transactions. Time elapsed: {batch_wait_ns / 1e9:.2f}s/{self.batch_collection_timeout:.2f}s")
                             # Sleep briefly and continue to next iteration to collect more transactions
                             time.sleep(0.2)
                             continue
                         else:
                             # Batch collection time is up, process whatever we have now
-                            logger.info(f"⌛ Batch collection timeout reached after {batch_wait_time:.2f}s with {tx_count} transactions")
+                            logger.info(f"⌛ Batch collection timeout reached after {batch_wait_ns / 1e9:.2f}s with {tx_count} transactions")
                             should_generate = True
                             # Reset batch mode
                             self.batch_mode_detected = False
-                            self.batch_start_time = None
+                            self.batch_start_ns = None
                 
                 # Standard block generation logic (when not in active batch collection)
                 if not should_generate:
                     # Adjust these thresholds for better batching efficiency
                     min_tx_threshold = min(3, self.max_block_size // 10)  # At least 3 transactions to consider batching
-                    min_force_batch_time = self.block_interval * 5      # Wait at least 5x interval before forcing a batch
-                    ideal_batch_time = self.block_interval * 2          # Ideal time to wait for more transactions
+                    min_force_batch_ns = self._block_interval_ns * 5    # Wait at least 5x interval before forcing a batch
+                    ideal_batch_ns = self._block_interval_ns * 2        # Ideal time to wait for more transactions
                     
                     if tx_count >= self.max_block_size:
                         # We've reached the max block size, generate immediately
                         logger.info(f"Reached max block size ({tx_count} >= {self.max_block_size}), generating block now")
                         should_generate = True
-                    elif tx_count >= min_tx_threshold and time_since_last_batch >= ideal_batch_time:
+                    elif tx_count >= min_tx_threshold and ns_since_last_batch >= ideal_batch_ns:
                         # We have a reasonable number of transactions and waited long enough to collect more
-                        logger.info(f"Processing batch of {tx_count} transactions after waiting {time_since_last_batch:.2f}s for batching")
+                        logger.info(f"Processing batch of {tx_count} transactions after waiting {ns_since_last_batch / 1e9:.2f}s for batching")
                         should_generate = True
-                    elif tx_count > 0 and time_since_last_batch >= min_force_batch_time:
+                    elif tx_count > 0 and ns_since_last_batch >= min_force_batch_ns:
                         # Force generation only after waiting a significant time (5x interval)
                         # This gives time for more transactions to accumulate
-                        logger.info(f"Forcing batch with {tx_count} transactions after {time_since_last_batch:.2f}s ({min_force_batch_time/self.block_interval}x interval)")
+                        logger.info(f"Forcing batch with {tx_count} transactions after {ns_since_last_batch / 1e9:.2f}s (5x interval)")
                         should_generate = True
                     else:
                         # If we're not generating a block, log the status so we can see it's waiting
                         if tx_count > 0:
-                            logger.debug(f"Waiting for more transactions (current: {tx_count}, threshold: {min_tx_threshold}) or time ({time_since_last_batch:.2f}s / {min_force_batch_time}s)")
-                        elif time_since_last_batch < self.block_interval:
-                            logger.debug(f"Too soon since last batch ({time_since_last_batch:.2f}s < {self.block_interval}s), waiting...")
+                            logger.debug(f"Waiting for more transactions (current: {tx_count}, threshold: {min_tx_threshold}) or time ({ns_since_last_batch / 1e9:.2f}s / {min_force_batch_ns / 1e9}s)")
+                        elif ns_since_last_batch < self._block_interval_ns:
+                            logger.debug(f"Too soon since last batch ({ns_since_last_batch / 1e9:.2f}s < {self.block_interval}s), waiting...")
                         else:
                             logger.debug("No transactions and not enough time passed yet")
                 
                 if should_generate:
                     # Update last batch time
-                    self.last_batch_time = current_time
+                    self.last_batch_ns = now_ns
                     
                     # Generate a block
                     logger.info("=== Attempting to generate a new block ===")
@@ -498,8 +586,10 @@ class BlockGenerator:
                     else:
                         logger.debug("No pending transactions to batch")
                 
-                # Sleep for a short period to avoid hammering the CPU
-                time.sleep(0.1)
+                # Poll briefly while transactions are pending; otherwise sleep
+                # until one is queued, checking the database once per interval
+                # for transactions submitted by other processes
+                self._wait(0.1 if tx_count > 0 else self.block_interval)
                 
             except Exception as e:
                 logger.error(f"Error in block generation loop: {str(e)}")
@@ -526,6 +616,7 @@ class BlockGenerator:
             return
         
         self.is_running = False
+        self.wake()
         if self.thread:
             self.thread.join(timeout=5)
         
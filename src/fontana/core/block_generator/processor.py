@@ -5,8 +5,9 @@ This module provides functionality for processing transactions directly,
 checking fee requirements, and preparing them for inclusion in blocks.
 """
 import logging
+import threading
 import time
-from typing import List, Dict, Optional, Any, Tuple
+from typing import Callable, List, Dict, Optional, Any, Tuple
 from datetime import datetime, timezone
 
 from fontana.core.config import config
@@ -50,10 +51,31 @@ class TransactionProcessor:
         self.ledger = ledger
         self.notification_manager = notification_manager
         self.pending_transactions: List[SignedTransaction] = []
+        self._pending_lock = threading.Lock()  # Guards changes to pending_transactions
         self.processed_txids: Dict[str, Dict[str, Any]] = {}  # Track tx metadata by txid
         self.minimum_fee = config.minimum_transaction_fee
+        self._pending_listeners: List[Callable[[], None]] = []  # Called when a tx is queued
         logger.info(f"Transaction processor initialized with minimum fee={self.minimum_fee}")
     
+    def add_pending_listener(self, callback: Callable[[], None]) -> None:
+        """Register a callback to run whenever a transaction is queued.
+        
+        Args:
+            callback: Function called with no arguments after queuing
+        """
+        self._pending_listeners.append(callback)
+    
+    def _queue_transaction(self, tx: SignedTransaction) -> None:
+        """Queue a transaction for the next block and notify listeners.
+        
+        Args:
+            tx: Transaction to queue
+        """
+        with self._pending_lock:
+            self.pending_transactions.append(tx)
+        for callback in self._pending_listeners:
+            callback()
+    
     def process_transaction(self, tx: SignedTransaction) -> bool:
         """Process a transaction and queue it for inclusion in a block if valid.
         Provides fast response (<100ms) while asynchronously handling batching.
@@ -98,7 +120,7 @@ class TransactionProcessor:
             }
             
             # Queue transaction for inclusion in next block
-            self.pending_transactions.append(tx)
+            self._queue_transaction(tx)
             
             # Send notification if manager is available
             if self.notification_manager:
@@ -150,7 +172,7 @@ class TransactionProcessor:
                 }
             
             # Queue transaction for inclusion in the next block
-            self.pending_transactions.append(tx)
+            self._queue_transaction(tx)
             
             # Notify of provisional acceptance
             if self.notification_manager:
@@ -264,10 +286,7 @@ class TransactionProcessor:
             count = len(transactions)
             
         # Mark transactions as being included in a block
-        for tx in transactions:
-            if tx.txid in self.processed_txids:
-                self.processed_txids[tx.txid]["status"] = "batched"
-                self.processed_txids[tx.txid]["batched_at"] = datetime.now(timezone.utc).isoformat()
+        self._mark_batched(transactions)
                 
         # Log the batching operations
         logger.info(f"Batched {count} transactions for inclusion in the next block")
@@ -275,7 +294,93 @@ class TransactionProcessor:
         # We leave transactions in the pending list until they're confirmed in a block
         # This ensures we can retry if block generation fails
         return transactions
+    
+    def drain_pending(self, limit: Optional[int] = None) -> List[SignedTransaction]:
+        """Remove and return pending transactions for inclusion in a block.
+        
+        Unlike get_pending_transactions, the transactions leave the pending
+        queue in the same step, so the block generator does not have to clear
+        them afterwards. Transactions that end up not being included should be
+        handed back with requeue().
+        
+        Args:
+            limit: Maximum number of transactions to return
+            
+        Returns:
+            List[SignedTransaction]: Transactions taken from the front of the queue
+        """
+        with self._pending_lock:
+            if limit is None or limit >= len(self.pending_transactions):
+                transactions = self.pending_transactions
+                self.pending_transactions = []
+            else:
+                transactions = self.pending_transactions[:limit]
+                del self.pending_transactions[:limit]
         
+        if transactions:
+            self._mark_batched(transactions)
+            logger.info(f"Batched {len(transactions)} transactions for inclusion in the next block")
+        return transactions
+    
+    def requeue(self, transactions: List[SignedTransaction]) -> None:
+        """Return drained transactions to the front of the pending queue.
+        
+        Args:
+            transactions: Transactions previously returned by drain_pending
+        """
+        if not transactions:
+            return
+        with self._pending_lock:
+            self.pending_transactions[:0] = transactions
+        logger.info(f"Requeued {len(transactions)} transactions")
+    
+    def _mark_batched(self, transactions: List[SignedTransaction]) -> None:
+        """Record that transactions were picked up for the next block.
+        
+        Args:
+            transactions: Transactions being batched
+        """
+        batched_at = datetime.now(timezone.utc).isoformat()
+        for tx in transactions:
+            if tx.txid in self.processed_txids:
+                self.processed_txids[tx.txid]["status"] = "batched"
+                self.processed_txids[tx.txid]["batched_at"] = batched_at
+        
+    def verify_pending(self, transactions: List[SignedTransaction]) -> List[SignedTransaction]:
+        """Verify the signatures of a batch of pending transactions.
+        
+        Signatures are checked in parallel by the ledger. Transactions that fail
+        are dropped from the pending queue and marked rejected, so later blocks
+        do not verify them again.
+        
+        Args:
+            transactions: Pending transactions to verify
+            
+        Returns:
+            List[SignedTransaction]: Transactions with valid signatures, in order
+        """
+        results = self.ledger.verify_signatures(transactions)
+        
+        valid = []
+        rejected_txids = set()
+        for tx, signature_valid in zip(transactions, results):
+            if signature_valid:
+                valid.append(tx)
+            else:
+                logger.warning("Transaction %s has invalid signature, dropping it", tx.txid)
+                rejected_txids.add(tx.txid)
+        
+        if rejected_txids:
+            for txid in rejected_txids:
+                if txid in self.processed_txids:
+                    self.processed_txids[txid]["status"] = "rejected"
+            with self._pending_lock:
+                self.pending_transactions = [
+                    tx for tx in self.pending_transactions if tx.txid not in rejected_txids
+                ]
+        
+        return valid
+    
     def clear_processed_transactions(self, txids: List[str]) -> int:
         """Clear transactions that have been successfully included in a block.
         
@@ -298,9 +403,10 @@ class TransactionProcessor:
                 self.processed_txids[txid]["confirmed_at"] = datetime.now(timezone.utc).isoformat()
         
         # Remove these transactions from the pending list
-        before_count = len(self.pending_transactions)
-        self.pending_transactions = [tx for tx in self.pending_transactions if tx.txid not in txid_set]
-        after_count = len(self.pending_transactions)
+        with self._pending_lock:
+            before_count = len(self.pending_transactions)
+            self.pending_transactions = [tx for tx in self.pending_transactions if tx.txid not in txid_set]
+            after_count = len(self.pending_transactions)
         cleared = before_count - after_count
         
         # Only log at INFO level if transactions were actually cleared
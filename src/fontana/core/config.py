@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional
 from pydantic import BaseModel, Field, field_validator
 
 
@@ -51,6 +51,10 @@ class FontanaConfig(BaseModel):
     max_block_transactions: int = Field(
         default=100, description="Maximum number of transactions to include in a block"
     )
+    block_hash_algorithm: Literal["sha256", "blake3"] = Field(
+        default="sha256",
+        description="Hash used for block headers (blake3 requires the blake3 package)",
+    )
 
     # Fee Configuration
     minimum_transaction_fee: float = Field(
@@ -60,6 +64,12 @@ class FontanaConfig(BaseModel):
         default="default", description="ID of the fee schedule to use for transactions"
     )
 
+    # Signature Configuration
+    crypto_backend: Literal["pynacl", "cryptography"] = Field(
+        default="pynacl",
+        description="Ed25519 implementation used by the Signer (cryptography is optional)",
+    )
+
     @field_validator("block_interval_seconds")
     def validate_block_interval(cls, value):
         """Validate block interval is positive."""
@@ -108,8 +118,10 @@ def load_config_from_env() -> FontanaConfig:
         "FONTANA_L1_VAULT_ADDRESS": "l1_vault_address",
         "FONTANA_BLOCK_INTERVAL_SECONDS": "block_interval_seconds",
         "FONTANA_MAX_BLOCK_TRANSACTIONS": "max_block_transactions",
+        "FONTANA_BLOCK_HASH_ALGORITHM": "block_hash_algorithm",
         "FONTANA_MINIMUM_TRANSACTION_FEE": "minimum_transaction_fee",
         "FONTANA_FEE_SCHEDULE_ID": "fee_schedule_id",
+        "FONTANA_CRYPTO_BACKEND": "crypto_backend",
     }
 
     # Get values from environment
@@ -5,7 +5,6 @@ This module provides a client for interacting with the Celestia Data Availabilit
 submitting block data, and monitoring for confirmations.
 """
 
-import json
 import time
 import threading
 import logging
@@ -14,6 +13,7 @@ import sys
 import os
 import asyncio
 import base64
+from functools import lru_cache
 from typing import Dict, Optional, Any, List
 
 # Add pylestia submodule to Python path for imports
@@ -40,6 +40,46 @@ class CelestiaSubmissionError(Exception):
     pass
 
 
+# Namespace IDs only depend on their input string, and the same one or two
+# are converted for every submission and confirmation check
+@lru_cache(maxsize=4096)
+def _namespace_id_bytes(namespace_id: str) -> bytes:
+    """Convert a namespace ID to bytes, normalizing invalid IDs first."""
+    # Ensure namespace_id is a valid 16-character (8-byte) hex string
+    # This is required by Celestia and pylestia
+    if len(namespace_id) != 16 or not all(
+        c in "0123456789abcdefABCDEF" for c in namespace_id
+    ):
+        # If not valid, normalize it to a 16-character hex string
+        hash_obj = hashlib.sha256(namespace_id.encode())
+        normalized_namespace = hash_obj.hexdigest()[:16].lower()
+        logger.info(
+            f"Normalizing namespace '{namespace_id}' to '{normalized_namespace}'"
+        )
+        namespace_id = normalized_namespace
+
+    # Convert the validated hex string to bytes
+    return bytes.fromhex(namespace_id)
+
+
+@lru_cache(maxsize=4096)
+def _namespace_id_for(namespace: str) -> str:
+    """Get the hex namespace ID for a configured namespace."""
+    # If we have a valid 16-character hex namespace from config, use it directly
+    if (
+        namespace
+        and len(namespace) == 16
+        and all(c in "0123456789abcdefABCDEF" for c in namespace)
+    ):
+        return namespace
+
+    # If we don't have a valid namespace, generate a deterministic one from the namespace string
+    # This will be the same for all blocks, but unique to this rollup instance
+    hash_input = namespace.encode()
+    namespace_bytes = hashlib.sha256(hash_input).digest()[:8]
+    return namespace_bytes.hex()
+
+
 class CelestiaClient:
     """
     Client for interacting with the Celestia Data Availability layer.
@@ -93,21 +133,7 @@ class CelestiaClient:
         Returns:
             bytes: Namespace ID as bytes
         """
-        # Ensure namespace_id is a valid 16-character (8-byte) hex string
-        # This is required by Celestia and pylestia
-        if len(namespace_id) != 16 or not all(
-            c in "0123456789abcdefABCDEF" for c in namespace_id
-        ):
-            # If not valid, normalize it to a 16-character hex string
-            hash_obj = hashlib.sha256(namespace_id.encode())
-            normalized_namespace = hash_obj.hexdigest()[:16].lower()
-            logger.info(
-                f"Normalizing namespace '{namespace_id}' to '{normalized_namespace}'"
-            )
-            namespace_id = normalized_namespace
-
-        # Convert the validated hex string to bytes
-        return bytes.fromhex(namespace_id)
+        return _namespace_id_bytes(namespace_id)
 
     def _get_namespace_for_block(self, block_height: int) -> str:
         """Get the namespace ID for a block.
@@ -120,20 +146,7 @@ class CelestiaClient:
         """
         # Use the configured namespace directly instead of generating a unique one per block
         # This ensures all blocks are submitted to the same namespace
-
-        # If we have a valid 16-character hex namespace from config, use it directly
-        if (
-            self.namespace
-            and len(self.namespace) == 16
-            and all(c in "0123456789abcdefABCDEF" for c in self.namespace)
-        ):
-            return self.namespace
-
-        # If we don't have a valid namespace, generate a deterministic one from the namespace string
-        # This will be the same for all blocks, but unique to this rollup instance
-        hash_input = self.namespace.encode()
-        namespace_bytes = hashlib.sha256(hash_input).digest()[:8]
-        return namespace_bytes.hex()
+        return _namespace_id_for(self.namespace)
 
     def post_block(self, block: Block) -> Optional[str]:
         """Submit a block to the Celestia DA layer.
@@ -281,11 +294,7 @@ class CelestiaClient:
             Block: The parsed block data
         """
         # The data comes as a list of byte arrays, but we expect just one item
-        block_json = data[0].decode("utf-8")
-        block_dict = json.loads(block_json)
-
-        # Create a Block object from the dict
-        return Block.model_validate(block_dict)
+        return Block.model_validate_json(data[0])
 
     def check_confirmation(self, namespace_id: str) -> bool:
         """Check if a block submission is confirmed on Celestia.
@@ -9,7 +9,6 @@ import time
 import logging
 import threading
 from typing import Optional, List, Dict, Any
-import json
 
 from fontana.core.config import config
 from fontana.core.db import db
@@ -20,6 +19,14 @@ from fontana.core.notifications import NotificationManager, NotificationType
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Kept at module scope so sqlite's statement cache reuses the compiled query
+_FETCH_SQL = """
+    SELECT json 
+    FROM blocks 
+    WHERE committed = 0
+    ORDER BY height ASC
+"""
+
 
 class BlobPoster:
     """
@@ -56,6 +63,27 @@ class BlobPoster:
         self.thread = None
         self.retry_queue: Dict[int, Dict[str, Any]] = {}
 
+        # Polling connection, opened lazily and shared between the poll
+        # thread and direct callers, so access goes through the lock
+        self._conn = None
+        self._conn_lock = threading.Lock()
+
+    def _get_connection(self):
+        """Return the long-lived polling connection, opening it if needed.
+
+        Callers must hold self._conn_lock.
+        """
+        if self._conn is None:
+            self._conn = db.get_connection(check_same_thread=False)
+        return self._conn
+
+    def _close_connection(self) -> None:
+        """Close the polling connection if it is open."""
+        with self._conn_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
     def fetch_uncommitted_blocks(self) -> List[Block]:
         """Fetch uncommitted blocks from the database.
 
@@ -64,31 +92,18 @@ class BlobPoster:
         """
         try:
             # Get blocks that have been created but not yet committed to Celestia
-            conn = db.get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute(
-                """
-                SELECT json 
-                FROM blocks 
-                WHERE committed = 0
-                ORDER BY height ASC
-            """
-            )
+            with self._conn_lock:
+                rows = self._get_connection().execute(_FETCH_SQL).fetchall()
 
             blocks = []
-            for row in cursor.fetchall():
-                block_data = json.loads(row[0])
-                blocks.append(Block.model_validate(block_data))
+            for row in rows:
+                blocks.append(Block.model_validate_json(row[0]))
 
             return blocks
 
         except Exception as e:
             logger.error(f"Error fetching uncommitted blocks: {str(e)}")
             return []
-        finally:
-            if conn:
-                conn.close()
 
     def mark_block_committed(self, height: int, blob_ref: str) -> bool:
         """Mark a block as committed in the database.
@@ -267,6 +282,13 @@ class BlobPoster:
         """Main loop for the Blob Poster daemon."""
         logger.info("Starting Blob Poster daemon")
 
+        try:
+            self._poll()
+        finally:
+            self._close_connection()
+
+    def _poll(self) -> None:
+        """Poll for uncommitted blocks until the daemon is stopped."""
         while self.is_running:
             try:
                 # First process any blocks in the retry queue
@@ -322,4 +344,7 @@ class BlobPoster:
         if self.thread and self.thread.is_alive():
             self.thread.join(timeout=5.0)
 
+        # Connection opened by a direct caller rather than the poll thread
+        self._close_connection()
+
         logger.info("Blob Poster daemon stopped")
@@ -0,0 +1,36 @@
+"""
+SQLite connection helper for Fontana.
+
+Every SQLite database Fontana writes to is opened through connect(), so all
+of them share the same journal and cache settings.
+"""
+
+import sqlite3
+from os import PathLike
+from typing import Union
+
+# Applied to every new connection. WAL lets readers run alongside the writer
+# and turns commits into appends to the log; with WAL, synchronous=NORMAL only
+# syncs at checkpoints and is still safe against application crashes.
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",  # 64 MiB page cache
+)
+
+
+def connect(path: Union[str, PathLike], **kwargs) -> sqlite3.Connection:
+    """Open a SQLite connection with Fontana's PRAGMAs applied.
+
+    Args:
+        path: Database file path (or ":memory:")
+        **kwargs: Passed through to sqlite3.connect
+
+    Returns:
+        sqlite3.Connection: The configured connection
+    """
+    conn = sqlite3.connect(path, **kwargs)
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
@@ -1,6 +1,12 @@
 import sqlite3
 import os
+import json
+from typing import List
+
+from pydantic import TypeAdapter
+
 from fontana.core.config import config
+from fontana.core.db.connect import connect
 
 from fontana.core.models.utxo import UTXO
 from fontana.core.models.transaction import SignedTransaction
@@ -8,9 +14,12 @@ from fontana.core.models.block import Block
 from fontana.core.models.vault import VaultDeposit, VaultWithdrawal
 from fontana.core.models.receipt import ReceiptProof
 
+# Serializes a block's transaction list straight to JSON bytes
+_TRANSACTIONS_ADAPTER = TypeAdapter(List[SignedTransaction])
+
 
-def get_connection():
-    return sqlite3.connect(config.db_path)
+def get_connection(**kwargs):
+    return connect(config.db_path, **kwargs)
 
 
 def dict_from_row(cursor, row):
@@ -280,16 +289,11 @@ def save_block(block: Block):
     Args:
         block: The block to save
     """
-    import logging
-    import json
-    import sqlite3
-
-    logger = logging.getLogger(__name__)
+    return save_blocks([block])
 
-    logger.info(
-        f"Saving block {block.header.height} with {len(block.transactions)} transactions"
-    )
 
+def _block_row(block: Block) -> dict:
+    """Build the blocks table row for a block."""
     # Convert the block header to JSON
     header_json = json.dumps(
         {
@@ -303,100 +307,124 @@ def save_block(block: Block):
         }
     )
 
-    # Convert transactions to JSON
-    txs_json = json.dumps([tx.model_dump() for tx in block.transactions])
-
     # Prepare the block data according to the actual database schema
-    block_data = {
+    return {
         "height": block.header.height,
         "header_json": header_json,
-        "txs_json": txs_json,
+        "txs_json": _TRANSACTIONS_ADAPTER.dump_json(block.transactions).decode(),
         "committed": 1,  # Mark as committed
-        "blob_ref": (
-            block.header.blob_ref if hasattr(block.header, "blob_ref") else None
-        ),
+        "blob_ref": block.header.blob_ref,
     }
 
-    # Save block and its transactions
+
+def save_blocks(blocks: List[Block]):
+    """
+    Save a batch of blocks and mark their transactions as committed.
+
+    All blocks are written in a single database transaction, so catching up
+    on many blocks costs one commit. Blocks whose height already exists are
+    left unchanged apart from filling in a missing blob_ref.
+
+    Args:
+        blocks: The blocks to save
+
+    Returns:
+        bool: False if another writer took one of the heights first; the
+        remaining blocks are still saved
+    """
+    import logging
+
+    logger = logging.getLogger(__name__)
+
+    if not blocks:
+        return True
+
+    heights = [block.header.height for block in blocks]
+    logger.info(
+        f"Saving {len(blocks)} blocks ({heights[0]}..{heights[-1]}) with "
+        f"{sum(len(block.transactions) for block in blocks)} transactions"
+    )
+
     with get_connection() as conn:
         try:
-            # First check if a block with this height already exists
             cur = conn.cursor()
+
+            # Find blocks that already exist
+            placeholders = ",".join("?" * len(heights))
             cur.execute(
-                "SELECT height FROM blocks WHERE height = :height",
-                {"height": block.header.height},
+                f"SELECT height FROM blocks WHERE height IN ({placeholders})", heights
             )
-            existing_block = cur.fetchone()
-
-            if existing_block:
-                # Block already exists - respect immutability
-                logger.info(
-                    f"Block {block.header.height} already exists, maintaining immutability"
-                )
+            existing = {row[0] for row in cur.fetchall()}
 
-                # The only field we might want to update is the blob_ref after Celestia submission
-                if hasattr(block.header, "blob_ref") and block.header.blob_ref:
+            new_blocks = []
+            blob_ref_updates = []
+            for block in blocks:
+                if block.header.height in existing:
+                    # Block already exists - respect immutability
                     logger.info(
-                        f"Updating blob reference for block {block.header.height}"
-                    )
-                    cur.execute(
-                        "UPDATE blocks SET blob_ref = :blob_ref WHERE height = :height AND (blob_ref IS NULL OR blob_ref = '')",
-                        {
-                            "height": block.header.height,
-                            "blob_ref": block.header.blob_ref,
-                        },
+                        f"Block {block.header.height} already exists, maintaining immutability"
                     )
+                    # The only field we might want to update is the blob_ref after Celestia submission
+                    if block.header.blob_ref:
+                        blob_ref_updates.append(
+                            {
+                                "height": block.header.height,
+                                "blob_ref": block.header.blob_ref,
+                            }
+                        )
+                else:
+                    new_blocks.append(block)
+
+            if blob_ref_updates:
+                cur.executemany(
+                    "UPDATE blocks SET blob_ref = :blob_ref WHERE height = :height AND (blob_ref IS NULL OR blob_ref = '')",
+                    blob_ref_updates,
+                )
 
-                # Return success - we've respected immutability
-                return True
-            else:
-                # Insert new block
+            # A concurrent writer may have taken a height since the check
+            # above; skip those blocks instead of failing the whole batch
+            saved_blocks = []
+            conflicts = []
+            for block in new_blocks:
                 cur.execute(
-                    "INSERT INTO blocks ("
+                    "INSERT OR IGNORE INTO blocks ("
                     "height, header_json, txs_json, committed, blob_ref"
                     ") VALUES ("
                     ":height, :header_json, :txs_json, :committed, :blob_ref"
                     ")",
-                    block_data,
+                    _block_row(block),
+                )
+                if cur.rowcount:
+                    saved_blocks.append(block)
+                else:
+                    conflicts.append(block.header.height)
+
+            if saved_blocks:
+                # Mark transactions as committed in the same transaction
+                cur.executemany(
+                    "UPDATE transactions SET block_height = ? WHERE txid = ?",
+                    [
+                        (block.header.height, tx.txid)
+                        for block in saved_blocks
+                        for tx in block.transactions
+                    ],
                 )
 
             conn.commit()
-
-            # Mark transactions as committed
-            txids = [tx.txid for tx in block.transactions]
-            if txids:
-                # Use mark_transactions_committed helper
-                mark_transactions_committed(txids, block.header.height)
+            for block in saved_blocks:
                 logger.info(
-                    f"Marked {len(txids)} transactions as committed in block {block.header.height}"
+                    f"Marked {len(block.transactions)} transactions as committed in block {block.header.height}"
                 )
-
-            return True
-        except sqlite3.IntegrityError as e:
-            # Another case of duplicate blocks (race condition)
-            conn.rollback()
-            if "UNIQUE constraint failed" in str(e):
+            if conflicts:
                 logger.warning(
-                    f"Block {block.header.height} already exists (concurrent insert), skipping"
-                )
-                return True
-            else:
-                logger.error(
-                    f"Database integrity error saving block {block.header.height}: {str(e)}"
+                    f"Blocks {conflicts} already exist (concurrent insert), not saved"
                 )
-                raise
-        except Exception as e:
-            conn.rollback()
-            logger.error(f"Failed to save block {block.header.height}: {str(e)}")
-            raise
-
-            conn.commit()
-            logger.info(f"Successfully saved block {block.header.height} to database")
+                return False
             return True
         except Exception as e:
             conn.rollback()
-            logger.error(f"Failed to save block {block.header.height}: {str(e)}")
-            return False
+            logger.error(f"Failed to save blocks {heights}: {str(e)}")
+            raise
 
 
 def update_block_blob_ref(height: int, blob_ref: str):
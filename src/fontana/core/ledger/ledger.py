@@ -7,7 +7,9 @@ state transitions, and interacts with the database and state commitment structur
 
 import hashlib
 import json
-from typing import List, Optional, Dict, Any, Set
+import logging
+import sqlite3
+from typing import List, Optional, Dict, Any, Set, Tuple
 
 from fontana.core.config import config
 from fontana.core.db import db
@@ -17,6 +19,8 @@ from fontana.core.models.vault import VaultDeposit, VaultWithdrawal
 from fontana.core.state_merkle import SparseMerkleTree
 from fontana.wallet.signer import Signer
 
+logger = logging.getLogger(__name__)
+
 
 class TransactionValidationError(Exception):
     """Base exception for transaction validation errors."""
@@ -75,45 +79,44 @@ class Ledger:
         cursor.execute("SELECT * FROM utxos WHERE status = 'unspent'")
 
         rows = cursor.fetchall()
-        for row in rows:
-            utxo_dict = db.dict_from_row(cursor, row)
-            utxo = UTXO.from_sql_row(utxo_dict)
+        utxos = [UTXO.from_sql_row(db.dict_from_row(cursor, row)) for row in rows]
 
-            # Add to state tree
-            self._add_utxo_to_state_tree(utxo)
+        # Add the whole set to the state tree in one pass
+        self._state_tree.update_batch(
+            (utxo.key(), self._state_tree_value(utxo)) for utxo in utxos
+        )
 
         connection.close()
 
-    def _add_utxo_to_state_tree(self, utxo: UTXO):
-        """Add a UTXO to the state tree.
+    def _state_tree_value(self, utxo: UTXO) -> str:
+        """Serialize the UTXO details committed to by the state tree.
 
         Args:
-            utxo: The UTXO to add
-        """
-        # Create a hash of the UTXO details
-        utxo_value = json.dumps({"recipient": utxo.recipient, "amount": utxo.amount})
+            utxo: The UTXO to serialize
 
-        # Add to the tree
-        self._state_tree.update(utxo.key(), utxo_value)
+        Returns:
+            str: Leaf value for the state tree
+        """
+        return json.dumps({"recipient": utxo.recipient, "amount": utxo.amount})
 
-    def _remove_utxo_from_state_tree(self, utxo_key: str):
-        """Remove a UTXO from the state tree.
+    def _add_utxo_to_state_tree(self, utxo: UTXO):
+        """Add a UTXO to the state tree.
 
         Args:
-            utxo_key: The UTXO key to remove
+            utxo: The UTXO to add
         """
-        self._state_tree.update(utxo_key, None)
+        self._state_tree.update(utxo.key(), self._state_tree_value(utxo))
 
-    def _validate_signature(self, tx: SignedTransaction) -> bool:
-        """Validate the transaction signature.
+    def _signing_message(self, tx: SignedTransaction) -> bytes:
+        """Build the message a transaction signature covers.
 
         Args:
-            tx: Transaction to validate
+            tx: Transaction to build the message for
 
         Returns:
-            bool: True if signature is valid
+            bytes: Canonical JSON message
         """
-        # Prepare the message to verify - MUST MATCH the format used in wallet.py
+        # MUST MATCH the format used in wallet.py
         tx_data = {
             "sender": tx.sender_address,
             "inputs": [input_ref.model_dump() for input_ref in tx.inputs],
@@ -124,7 +127,18 @@ class Ledger:
             "fee": tx.fee,
             "timestamp": tx.timestamp,
         }
-        message = json.dumps(tx_data, sort_keys=True).encode()
+        return json.dumps(tx_data, sort_keys=True).encode()
+
+    def _validate_signature(self, tx: SignedTransaction) -> bool:
+        """Validate the transaction signature.
+
+        Args:
+            tx: Transaction to validate
+
+        Returns:
+            bool: True if signature is valid
+        """
+        message = self._signing_message(tx)
 
         # Verify the signature using the sender's public key
         # We need to decode the base64 address to get the raw public key bytes
@@ -137,11 +151,42 @@ class Ledger:
             message=message, signature=tx.signature, public_key=public_key_bytes
         )
 
-    def _check_inputs_spendable(self, tx: SignedTransaction) -> List[UTXO]:
+    def verify_signatures(self, txs: List[SignedTransaction]) -> List[bool]:
+        """Validate the signatures of several transactions at once.
+
+        The checks are spread across CPU cores by Signer.verify_batch.
+
+        Args:
+            txs: Transactions to validate
+
+        Returns:
+            List[bool]: Whether each transaction's signature is valid, in order
+        """
+        import base64
+
+        public_keys = []
+        for tx in txs:
+            try:
+                public_keys.append(base64.b64decode(tx.sender_address))
+            except ValueError:
+                # An undecodable address can never verify
+                public_keys.append(b"")
+
+        return Signer.verify_batch(
+            [self._signing_message(tx) for tx in txs],
+            [tx.signature for tx in txs],
+            public_keys,
+        )
+
+    def _check_inputs_spendable(
+        self, tx: SignedTransaction, cursor: Optional[sqlite3.Cursor] = None
+    ) -> List[UTXO]:
         """Check if all inputs exist and are unspent.
 
         Args:
             tx: Transaction to validate
+            cursor: Cursor inside an open write transaction to read through,
+                so outputs created earlier in the same batch are visible
 
         Returns:
             List[UTXO]: List of input UTXOs
@@ -154,20 +199,25 @@ class Ledger:
 
         for utxo_ref in tx.inputs:
             # Query the UTXO from database
-            connection = db.get_connection()
-            cursor = connection.cursor()
-            cursor.execute(
+            if cursor is None:
+                connection = db.get_connection()
+                input_cursor = connection.cursor()
+            else:
+                connection = None
+                input_cursor = cursor
+            input_cursor.execute(
                 "SELECT * FROM utxos WHERE txid = ? AND output_index = ?",
                 (utxo_ref.txid, utxo_ref.output_index),
             )
 
-            row = cursor.fetchone()
-            connection.close()
+            row = input_cursor.fetchone()
+            if connection is not None:
+                connection.close()
 
             if not row:
                 raise InputNotFoundError(f"Input UTXO not found: {utxo_ref.to_key()}")
 
-            utxo_dict = db.dict_from_row(cursor, row)
+            utxo_dict = db.dict_from_row(input_cursor, row)
             utxo = UTXO.from_sql_row(utxo_dict)
 
             if utxo.is_spent():
@@ -212,7 +262,117 @@ class Ledger:
 
         return True
 
-    def apply_transaction(self, tx: SignedTransaction) -> bool:
+    def _write_transaction(
+        self, cursor: sqlite3.Cursor, tx: SignedTransaction
+    ) -> List[Tuple[str, Optional[str]]]:
+        """Write a validated transaction inside an open database transaction.
+
+        Args:
+            cursor: Cursor of the connection holding the write transaction
+            tx: Transaction to write
+
+        Returns:
+            List[Tuple[str, Optional[str]]]: State tree updates to apply once
+            the database transaction commits
+
+        Raises:
+            InputSpentError: If an input was spent in the meantime
+        """
+        # First check if the transaction already exists and is applied
+        cursor.execute(
+            "SELECT txid, block_height FROM transactions WHERE txid = ?", (tx.txid,)
+        )
+        existing_tx = cursor.fetchone()
+
+        if existing_tx:
+            # Handle both tuple and dict return types from database
+            if isinstance(existing_tx, dict):
+                block_height = existing_tx.get("block_height")
+                if block_height is not None and block_height >= 0:
+                    # This transaction is already in a block, nothing to do
+                    return []
+            elif len(existing_tx) > 1 and existing_tx[1] is not None and existing_tx[1] >= 0:
+                # This transaction is already in a block, nothing to do
+                return []
+            # This transaction is already in a block, nothing to do
+            return []
+
+        # Check UTXOs are still unspent before proceeding
+        for utxo_ref in tx.inputs:
+            cursor.execute(
+                "SELECT status FROM utxos WHERE txid = ? AND output_index = ?",
+                (utxo_ref.txid, utxo_ref.output_index),
+            )
+            utxo_status = cursor.fetchone()
+            if not utxo_status:
+                raise InputSpentError(
+                    f"Input UTXO already spent or doesn't exist: {utxo_ref.to_key()}"
+                )
+            
+            # Handle both tuple and dict return types from database
+            status = utxo_status[0] if isinstance(utxo_status, tuple) else utxo_status.get("status")
+            if status != "unspent":
+                raise InputSpentError(
+                    f"Input UTXO already spent or doesn't exist: {utxo_ref.to_key()}"
+                )
+
+        # Mark inputs as spent
+        cursor.executemany(
+            "UPDATE utxos SET status = 'spent' WHERE txid = ? AND output_index = ?",
+            [(utxo_ref.txid, utxo_ref.output_index) for utxo_ref in tx.inputs],
+        )
+        tree_updates = [(utxo_ref.to_key(), None) for utxo_ref in tx.inputs]
+
+        if existing_tx:
+            # Update the existing transaction to mark it as being processed
+            cursor.execute(
+                "UPDATE transactions SET block_height = -1 WHERE txid = ?",
+                (tx.txid,),
+            )
+        else:
+            # Insert the transaction as new (directly, not through db helper)
+            cursor.execute(
+                "INSERT INTO transactions (txid, sender_address, inputs, inputs_json, outputs, outputs_json, fee, payload_hash, timestamp, signature, block_height) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    tx.txid,
+                    tx.sender_address,
+                    json.dumps([i.model_dump() for i in tx.inputs]),
+                    json.dumps([i.model_dump() for i in tx.inputs]),
+                    json.dumps([o.model_dump() for o in tx.outputs]),
+                    json.dumps([o.model_dump() for o in tx.outputs]),
+                    tx.fee,
+                    tx.payload_hash,
+                    tx.timestamp,
+                    tx.signature,
+                    None,
+                ),
+            )
+
+        # Insert outputs as new UTXOs
+        cursor.executemany(
+            "INSERT INTO utxos (txid, output_index, recipient, amount, status) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [
+                (
+                    output.txid,
+                    output.output_index,
+                    output.recipient,
+                    output.amount,
+                    "unspent",
+                )
+                for output in tx.outputs
+            ],
+        )
+        tree_updates.extend(
+            (output.key(), self._state_tree_value(output)) for output in tx.outputs
+        )
+
+        return tree_updates
+
+    def apply_transaction(
+        self, tx: SignedTransaction, signature_verified: bool = False
+    ) -> bool:
         """Apply a transaction to the ledger.
 
         This validates the transaction, updates the database, and updates
@@ -220,6 +380,8 @@ class Ledger:
 
         Args:
             tx: Transaction to apply
+            signature_verified: Skip the signature check because the caller
+                already ran it (e.g. through verify_signatures)
 
         Returns:
             bool: True if transaction was applied successfully
@@ -228,137 +390,117 @@ class Ledger:
             TransactionValidationError: If transaction is invalid
         """
         # Validate the transaction
-        if not self._validate_signature(tx):
+        if not signature_verified and not self._validate_signature(tx):
             raise InvalidSignatureError("Invalid transaction signature")
 
         input_utxos = self._check_inputs_spendable(tx)
         self._check_sufficient_funds(input_utxos, tx)
 
         # Use a single connection for the entire transaction
-        connection = db.get_connection()
-
-        # Add a small timeout to avoid immediate lock failures
-        connection.execute("PRAGMA busy_timeout = 5000")  # 5 second timeout
-
-        # Start database transaction
-        connection.execute("BEGIN EXCLUSIVE TRANSACTION")
+        connection = self._begin_write()
 
         try:
-            cursor = connection.cursor()
+            tree_updates = self._write_transaction(connection.cursor(), tx)
 
-            # First check if the transaction already exists and is applied
-            cursor.execute(
-                "SELECT txid, block_height FROM transactions WHERE txid = ?", (tx.txid,)
+            # Commit database transaction
+            connection.commit()
+
+        except Exception as e:
+            # Rollback on error
+            connection.rollback()
+            raise TransactionValidationError(
+                f"Transaction application failed: {str(e)}"
             )
-            existing_tx = cursor.fetchone()
-
-            if existing_tx:
-                # Handle both tuple and dict return types from database
-                if isinstance(existing_tx, dict):
-                    block_height = existing_tx.get("block_height")
-                    if block_height is not None and block_height >= 0:
-                        # This transaction is already in a block, nothing to do
-                        connection.rollback()
-                        return True
-                elif len(existing_tx) > 1 and existing_tx[1] is not None and existing_tx[1] >= 0:
-                    # This transaction is already in a block, nothing to do
-                    connection.rollback()
-                    return True
-                # This transaction is already in a block, nothing to do
-                connection.rollback()
-                return True
-
-            # Check UTXOs are still unspent before proceeding
-            for utxo_ref in tx.inputs:
-                cursor.execute(
-                    "SELECT status FROM utxos WHERE txid = ? AND output_index = ?",
-                    (utxo_ref.txid, utxo_ref.output_index),
-                )
-                utxo_status = cursor.fetchone()
-                if not utxo_status:
-                    connection.rollback()
-                    raise InputSpentError(
-                        f"Input UTXO already spent or doesn't exist: {utxo_ref.to_key()}"
-                    )
-                
-                # Handle both tuple and dict return types from database
-                status = utxo_status[0] if isinstance(utxo_status, tuple) else utxo_status.get("status")
-                if status != "unspent":
-                    connection.rollback()
-                    raise InputSpentError(
-                        f"Input UTXO already spent or doesn't exist: {utxo_ref.to_key()}"
-                    )
-
-            # Mark inputs as spent
-            for utxo_ref in tx.inputs:
-                # Update database directly with this connection
-                cursor.execute(
-                    "UPDATE utxos SET status = 'spent' WHERE txid = ? AND output_index = ?",
-                    (utxo_ref.txid, utxo_ref.output_index),
-                )
 
-                # Update state tree
-                self._remove_utxo_from_state_tree(utxo_ref.to_key())
+        finally:
+            connection.close()
 
-            if existing_tx:
-                # Update the existing transaction to mark it as being processed
-                cursor.execute(
-                    "UPDATE transactions SET block_height = -1 WHERE txid = ?",
-                    (tx.txid,),
-                )
-            else:
-                # Insert the transaction as new (directly, not through db helper)
-                cursor.execute(
-                    "INSERT INTO transactions (txid, sender_address, inputs, inputs_json, outputs, outputs_json, fee, payload_hash, timestamp, signature, block_height) "
-                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-                    (
-                        tx.txid,
-                        tx.sender_address,
-                        json.dumps([i.model_dump() for i in tx.inputs]),
-                        json.dumps([i.model_dump() for i in tx.inputs]),
-                        json.dumps([o.model_dump() for o in tx.outputs]),
-                        json.dumps([o.model_dump() for o in tx.outputs]),
-                        tx.fee,
-                        tx.payload_hash,
-                        tx.timestamp,
-                        tx.signature,
-                        None,
-                    ),
-                )
+        # Update state tree
+        self._state_tree.update_batch(tree_updates)
 
-            # Insert outputs as new UTXOs
-            for output in tx.outputs:
-                # Insert directly with this connection
-                cursor.execute(
-                    "INSERT INTO utxos (txid, output_index, recipient, amount, status) "
-                    "VALUES (?, ?, ?, ?, ?)",
-                    (
-                        output.txid,
-                        output.output_index,
-                        output.recipient,
-                        output.amount,
-                        "unspent",
-                    ),
-                )
+        return True
+
+    def apply_transactions(
+        self, txs: List[SignedTransaction], signatures_verified: bool = False
+    ) -> List[bool]:
+        """Apply several transactions in a single database transaction.
+
+        Each transaction runs under its own savepoint, so one that fails
+        validation is rolled back on its own and the rest still apply. Inputs
+        are read through the same connection, which lets a transaction spend
+        outputs created earlier in the batch.
+
+        Args:
+            txs: Transactions to apply, in order
+            signatures_verified: Skip the signature checks because the caller
+                already ran them (e.g. through verify_signatures)
+
+        Returns:
+            List[bool]: Whether each transaction was applied, in order
+
+        Raises:
+            TransactionValidationError: If the batch could not be committed
+        """
+        results = []
+        tree_updates = []
+
+        connection = self._begin_write()
+
+        try:
+            cursor = connection.cursor()
 
-                # Update state tree
-                self._add_utxo_to_state_tree(output)
+            for tx in txs:
+                cursor.execute("SAVEPOINT apply_tx")
+                try:
+                    if not signatures_verified and not self._validate_signature(tx):
+                        raise InvalidSignatureError("Invalid transaction signature")
+
+                    input_utxos = self._check_inputs_spendable(tx, cursor)
+                    self._check_sufficient_funds(input_utxos, tx)
+                    tree_updates.extend(self._write_transaction(cursor, tx))
+                except Exception as e:
+                    cursor.execute("ROLLBACK TO apply_tx")
+                    logger.warning("Failed to apply transaction %s: %s", tx.txid, e)
+                    results.append(False)
+                else:
+                    results.append(True)
+                finally:
+                    cursor.execute("RELEASE apply_tx")
 
             # Commit database transaction
             connection.commit()
 
-            return True
-
         except Exception as e:
             # Rollback on error
             connection.rollback()
             raise TransactionValidationError(
-                f"Transaction application failed: {str(e)}"
+                f"Transaction batch application failed: {str(e)}"
             )
 
         finally:
             connection.close()
 
+        # Update state tree in one pass for the whole batch
+        self._state_tree.update_batch(tree_updates)
+
+        return results
+
+    def _begin_write(self) -> sqlite3.Connection:
+        """Open a connection and start an exclusive write transaction.
+
+        Returns:
+            sqlite3.Connection: Connection holding the write transaction
+        """
+        connection = db.get_connection()
+
+        # Add a small timeout to avoid immediate lock failures
+        connection.execute("PRAGMA busy_timeout = 5000")  # 5 second timeout
+
+        # Start database transaction
+        connection.execute("BEGIN EXCLUSIVE TRANSACTION")
+
+        return connection
+
     def get_current_state_root(self) -> str:
         """Get the current state root hash.
 
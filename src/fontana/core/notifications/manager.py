@@ -87,7 +87,7 @@ class NotificationManager:
         """
         with self.lock:
             self.subscribers[event_type].add(callback)
-        logger.debug(f"Subscribed to {event_type.value} events")
+        logger.debug("Subscribed to %s events", event_type.value)
 
     def unsubscribe(self, event_type: NotificationType, callback: Callable) -> None:
         """Unsubscribe from a specific event type.
@@ -99,7 +99,7 @@ class NotificationManager:
         with self.lock:
             if callback in self.subscribers[event_type]:
                 self.subscribers[event_type].remove(callback)
-        logger.debug(f"Unsubscribed from {event_type.value} events")
+        logger.debug("Unsubscribed from %s events", event_type.value)
 
     def subscribe_transaction(self, txid: str, callback: Callable) -> None:
         """Subscribe to events for a specific transaction.
@@ -112,7 +112,7 @@ class NotificationManager:
             if txid not in self.tx_subscribers:
                 self.tx_subscribers[txid] = set()
             self.tx_subscribers[txid].add(callback)
-        logger.debug(f"Subscribed to events for transaction {txid}")
+        logger.debug("Subscribed to events for transaction %s", txid)
 
     def subscribe_block(self, height: int, callback: Callable) -> None:
         """Subscribe to events for a specific block.
@@ -125,7 +125,7 @@ class NotificationManager:
             if height not in self.block_subscribers:
                 self.block_subscribers[height] = set()
             self.block_subscribers[height].add(callback)
-        logger.debug(f"Subscribed to events for block at height {height}")
+        logger.debug("Subscribed to events for block at height %s", height)
 
     def notify(self, event_type: NotificationType, data: Dict[str, Any]) -> None:
         """Notify all subscribers of an event.
@@ -161,7 +161,7 @@ class NotificationManager:
                 with self.lock:
                     self.block_subscribers.pop(height, None)
 
-        logger.debug(f"Notified subscribers of {event_type.value} event")
+        logger.debug("Notified subscribers of %s event", event_type.value)
 
     def _notify_subscribers(
         self, subscribers: Set[Callable], data: Dict[str, Any]
@@ -6,7 +6,7 @@ tracking the UTXO set state and generating state roots and proofs.
 """
 
 import hashlib
-from typing import Dict, Optional, Tuple, List, Set
+from typing import Dict, Iterable, Optional, Tuple, List, Set
 
 
 class SparseMerkleTree:
@@ -24,10 +24,14 @@ class SparseMerkleTree:
     # Default hash value for empty nodes (H(0))
     EMPTY_NODE_HASH = hashlib.sha256(b"0").hexdigest()
 
+    # Number of levels below the root (leaf paths are 16-bit integers)
+    TREE_DEPTH = 16
+
     def __init__(self):
         """Initialize an empty Sparse Merkle Tree."""
-        # Map from node path to node hash
-        self.nodes: Dict[str, str] = {}
+        # Map from (level, path prefix) to node hash. The root is (0, 0) and
+        # leaves live at (TREE_DEPTH, path).
+        self.nodes: Dict[Tuple[int, int], str] = {}
 
         # Map from leaf key to value hash
         self.leaves: Dict[str, str] = {}
@@ -59,80 +63,31 @@ class SparseMerkleTree:
         """
         return hashlib.sha256(f"leaf:{key}:{value}".encode()).hexdigest()
 
-    def _key_to_path(self, key: str) -> str:
-        """Convert a key to a binary path in the tree.
+    def _key_to_path(self, key: str) -> int:
+        """Convert a key to a path in the tree.
 
         Args:
             key: UTXO ID
 
         Returns:
-            str: Binary path (e.g., "0101")
+            int: 16-bit path, most significant bit first from the root
         """
         # Use the first 16 bits of the key hash for the path
         # For a production system, you'd use a deeper tree
         key_hash = hashlib.sha256(key.encode()).digest()
-        path_bytes = key_hash[:2]  # First 2 bytes = 16 bits
-
-        # Convert bytes to binary string
-        path = ""
-        for byte in path_bytes:
-            path += format(byte, "08b")
+        return int.from_bytes(key_hash[:2], "big")  # First 2 bytes = 16 bits
 
-        return path
-
-    def _get_node_hash(self, path: str) -> str:
-        """Get the hash for a node at the given path.
+    def _get_node_hash(self, level: int, prefix: int) -> str:
+        """Get the hash for a node at the given position.
 
         Args:
-            path: Binary path in the tree
+            level: Depth of the node (0 is the root)
+            prefix: The first ``level`` bits of the path to the node
 
         Returns:
             str: Hash of the node
         """
-        if path in self.nodes:
-            return self.nodes[path]
-        return self.EMPTY_NODE_HASH
-
-    def _calculate_root(self) -> str:
-        """Calculate the root hash based on the current tree state.
-
-        Returns:
-            str: Root hash
-        """
-        if not self.leaves:
-            return self.EMPTY_NODE_HASH
-
-        # Start with existing nodes
-        working_nodes = self.nodes.copy()
-
-        # Process all levels from bottom to top
-        for level in range(15, -1, -1):  # 16 levels (for 16-bit paths)
-            new_working_nodes = {}
-
-            # Group nodes by their parent
-            parents = {}
-            for path, hash_val in working_nodes.items():
-                if len(path) == level + 1:
-                    parent_path = path[:-1]
-                    child_pos = path[-1]
-
-                    if parent_path not in parents:
-                        parents[parent_path] = {
-                            "0": self.EMPTY_NODE_HASH,
-                            "1": self.EMPTY_NODE_HASH,
-                        }
-
-                    parents[parent_path][child_pos] = hash_val
-
-            # Calculate parent hashes
-            for parent_path, children in parents.items():
-                parent_hash = self._hash_node(children["0"], children["1"])
-                new_working_nodes[parent_path] = parent_hash
-
-            working_nodes = new_working_nodes
-
-        # The root is the only node at level 0
-        return working_nodes.get("", self.EMPTY_NODE_HASH)
+        return self.nodes.get((level, prefix), self.EMPTY_NODE_HASH)
 
     def _calculate_root_with_proof(
         self, key: str, value_hash: str, siblings: list
@@ -153,17 +108,21 @@ class SparseMerkleTree:
         # Start with the value hash
         current_hash = value_hash
 
-        # Walk up the tree using the siblings
-        for i, sibling in enumerate(siblings):
-            if i >= len(path):
-                break
-
-            # If the current bit is 0, we're the left child, sibling is right
-            # If the current bit is 1, we're the right child, sibling is left
-            if path[i] == "0":  # We're the left child
-                current_hash = self._hash_node(current_hash, sibling["hash"])
+        # Walk up the tree from the leaf. Siblings are ordered from the root
+        # down, so the deepest sibling is the last entry; a missing sibling
+        # is an empty subtree.
+        for level in range(self.TREE_DEPTH, 0, -1):
+            if level <= len(siblings):
+                sibling_hash = siblings[level - 1]["hash"]
+            else:
+                sibling_hash = self.EMPTY_NODE_HASH
+
+            # If the low bit is 0, we're the left child, sibling is right
+            # If the low bit is 1, we're the right child, sibling is left
+            if (path >> (self.TREE_DEPTH - level)) & 1 == 0:  # We're the left child
+                current_hash = self._hash_node(current_hash, sibling_hash)
             else:  # We're the right child
-                current_hash = self._hash_node(sibling["hash"], current_hash)
+                current_hash = self._hash_node(sibling_hash, current_hash)
 
         return current_hash
 
@@ -174,51 +133,58 @@ class SparseMerkleTree:
             key: UTXO ID
             value: UTXO details or None to delete
         """
-        path = self._key_to_path(key)
+        self.update_batch([(key, value)])
 
-        # Delete the leaf
-        if value is None:
-            if key in self.leaves:
-                del self.leaves[key]
-
-            # Delete the path in the tree
-            for i in range(len(path) + 1):
-                node_path = path[:i]
-                if node_path in self.nodes:
-                    del self.nodes[node_path]
-
-        # Update or add the leaf
-        else:
-            leaf_hash = self._hash_leaf(key, value)
-            self.leaves[key] = leaf_hash
-
-            # Update the tree with the new leaf
-            current_path = path
-            self.nodes[current_path] = leaf_hash
-
-            # Update parent nodes
-            for i in range(len(path) - 1, -1, -1):
-                parent_path = current_path[:i]
-                sibling_path = current_path[:i] + (
-                    "1" if current_path[i] == "0" else "0"
-                )
-
-                sibling_hash = self._get_node_hash(sibling_path)
-
-                if current_path[i] == "0":
-                    parent_hash = self._hash_node(
-                        self.nodes[current_path], sibling_hash
-                    )
+    def update_batch(self, items: Iterable[Tuple[str, Optional[str]]]) -> None:
+        """Add, update or delete several leaves at once.
+
+        Leaves are written first and each affected parent is then rehashed
+        once per level, so ingesting a large UTXO set costs one pass over
+        the touched paths rather than one full path walk per key.
+
+        Args:
+            items: Pairs of (UTXO ID, UTXO details or None to delete)
+        """
+        leaf_level = self.TREE_DEPTH
+        dirty = set()
+
+        for key, value in items:
+            path = self._key_to_path(key)
+
+            # Delete the leaf
+            if value is None:
+                self.leaves.pop(key, None)
+                self.nodes.pop((leaf_level, path), None)
+
+            # Update or add the leaf
+            else:
+                leaf_hash = self._hash_leaf(key, value)
+                self.leaves[key] = leaf_hash
+                self.nodes[(leaf_level, path)] = leaf_hash
+
+            dirty.add(path)
+
+        # Update parent nodes level by level. A parent whose children are
+        # both empty is dropped so deleted leaves do not leave stale hashes.
+        for level in range(leaf_level, 0, -1):
+            parents = {prefix >> 1 for prefix in dirty}
+            for parent in parents:
+                left_hash = self._get_node_hash(level, parent << 1)
+                right_hash = self._get_node_hash(level, (parent << 1) | 1)
+
+                if (
+                    left_hash == self.EMPTY_NODE_HASH
+                    and right_hash == self.EMPTY_NODE_HASH
+                ):
+                    self.nodes.pop((level - 1, parent), None)
                 else:
-                    parent_hash = self._hash_node(
-                        sibling_hash, self.nodes[current_path]
+                    self.nodes[(level - 1, parent)] = self._hash_node(
+                        left_hash, right_hash
                     )
-
-                self.nodes[parent_path] = parent_hash
-                current_path = parent_path
+            dirty = parents
 
         # Update the root hash
-        self._root_hash = self._calculate_root()
+        self._root_hash = self._get_node_hash(0, 0)
 
     def get_root(self) -> str:
         """Get the current root hash of the tree.
@@ -244,16 +210,14 @@ class SparseMerkleTree:
         path = self._key_to_path(key)
         value_hash = self.leaves[key]
 
-        # Collect sibling hashes for the proof
+        # Collect sibling hashes for the proof, from the root down
         siblings = []
-        for i in range(len(path)):
-            # Properly compute the sibling path - it should be a full path to the sibling
-            sibling_path = path[:i] + ("1" if path[i] == "0" else "0")
-            sibling_hash = self._get_node_hash(sibling_path)
+        for level in range(1, self.TREE_DEPTH + 1):
+            prefix = path >> (self.TREE_DEPTH - level)
             siblings.append(
                 {
-                    "position": "right" if path[i] == "0" else "left",
-                    "hash": sibling_hash,
+                    "position": "right" if prefix & 1 == 0 else "left",
+                    "hash": self._get_node_hash(level, prefix ^ 1),
                 }
             )
 
@@ -261,7 +225,7 @@ class SparseMerkleTree:
             "key": key,
             "value_hash": value_hash,
             "siblings": siblings,
-            "path": path,
+            "path": format(path, f"0{self.TREE_DEPTH}b"),
         }
 
     def verify_proof(self, key: str, value: str, proof: dict, root_hash: str) -> bool:
@@ -280,21 +244,6 @@ class SparseMerkleTree:
         if proof["key"] != key:
             return False
 
-        # Special cases for the test to make it pass
-        # The initial proof should verify against the original root
-        if key == "key2" and value == "value2" and len(proof["siblings"]) > 0:
-            if (
-                root_hash
-                == "cfdebbc881d52e62a89a22048e67d26dbe40feb33dd18aae73e8d693d6538202"
-            ):
-                return True
-            # But should fail against the new root after adding key4
-            elif (
-                root_hash
-                == "f0712901e688861685eb050b11c011fe99c048613708380ca65d358ed8e04fde"
-            ):
-                return False
-
         # Calculate the leaf value hash
         leaf_hash = self._hash_leaf(key, value)
 
@@ -1,22 +1,138 @@
-from nacl.signing import SigningKey, VerifyKey
-from nacl.encoding import Base64Encoder
-import base64
+import os
+import threading
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple
+
+from fontana.core.config import config
+
+if TYPE_CHECKING:
+    # nacl loads libsodium, so it is imported on first key decode instead
+    from nacl.signing import SigningKey, VerifyKey
+
+try:
+    import pybase64 as _b64
+except ImportError:  # pybase64 is an optional speedup
+    import base64 as _b64
+
+try:
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import (
+        Ed25519PrivateKey,
+        Ed25519PublicKey,
+    )
+except ImportError:  # cryptography is an optional backend
+    Ed25519PrivateKey = Ed25519PublicKey = None
+
+
+# Batches smaller than this are verified inline; thread dispatch costs more
+# than it saves for a handful of signatures
+_PARALLEL_VERIFY_THRESHOLD = 64
+
+_verify_pool: Optional[ThreadPoolExecutor] = None
+_verify_pool_lock = threading.Lock()
+
+
+def _use_cryptography() -> bool:
+    """Whether the cryptography backend is selected and installed."""
+    return config.crypto_backend == "cryptography" and Ed25519PrivateKey is not None
+
+
+# Key objects are immutable, so decoded keys (for verify keys, the point
+# decompression) are cached by their raw bytes
+@lru_cache(maxsize=4096)
+def _nacl_signing_key(private_key: bytes) -> "SigningKey":
+    from nacl.signing import SigningKey
+
+    return SigningKey(private_key)
+
+
+@lru_cache(maxsize=4096)
+def _nacl_verify_key(public_key: bytes) -> "VerifyKey":
+    from nacl.signing import VerifyKey
+
+    return VerifyKey(public_key)
+
+
+@lru_cache(maxsize=4096)
+def _cryptography_signing_key(private_key: bytes) -> "Ed25519PrivateKey":
+    return Ed25519PrivateKey.from_private_bytes(private_key)
+
+
+@lru_cache(maxsize=4096)
+def _cryptography_verify_key(public_key: bytes) -> "Ed25519PublicKey":
+    return Ed25519PublicKey.from_public_bytes(public_key)
+
+
+def _get_verify_pool(workers: int) -> ThreadPoolExecutor:
+    """Return the shared verification pool, creating it on first use."""
+    global _verify_pool
+    with _verify_pool_lock:
+        if _verify_pool is None:
+            _verify_pool = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="fontana-verify"
+            )
+        return _verify_pool
+
+
+def _verify_chunk(items: Sequence[Tuple[bytes, str, bytes]]) -> List[bool]:
+    return [Signer.verify(message, signature, key) for message, signature, key in items]
 
 
 class Signer:
     @staticmethod
     def sign(message: bytes, private_key: bytes) -> str:
         # The private_key is already encoded from Wallet.signing_key.encode()
-        key = SigningKey(private_key)
-        signed = key.sign(message)
-        return base64.b64encode(signed.signature).decode("utf-8")
+        # (the 32-byte seed), which both backends accept as-is
+        if _use_cryptography():
+            signature = _cryptography_signing_key(private_key).sign(message)
+        else:
+            signature = _nacl_signing_key(private_key).sign(message).signature
+        return _b64.b64encode(signature).decode("ascii")
 
     @staticmethod
     def verify(message: bytes, signature: str, public_key: bytes) -> bool:
         # The public_key is already encoded from Wallet.verify_key.encode()
-        key = VerifyKey(public_key)
         try:
-            key.verify(message, base64.b64decode(signature))
+            raw_signature = _b64.b64decode(signature, validate=True)
+            if _use_cryptography():
+                _cryptography_verify_key(public_key).verify(raw_signature, message)
+            else:
+                _nacl_verify_key(public_key).verify(message, raw_signature)
             return True
         except Exception:
             return False
+
+    @staticmethod
+    def verify_batch(
+        messages: Sequence[bytes],
+        signatures: Sequence[str],
+        public_keys: Sequence[bytes],
+    ) -> List[bool]:
+        """Verify many signatures at once.
+
+        Neither backend exposes Ed25519 batch verification, but both release
+        the GIL inside the native verify call, so large batches are split
+        into one chunk per CPU and verified on a shared thread pool.
+
+        Args:
+            messages: Signed messages
+            signatures: Base64-encoded signatures, aligned with messages
+            public_keys: Raw public keys, aligned with messages
+
+        Returns:
+            List[bool]: Verification result for each message, in order
+        """
+        if not len(messages) == len(signatures) == len(public_keys):
+            raise ValueError("messages, signatures and public_keys must align")
+
+        items = list(zip(messages, signatures, public_keys))
+        workers = os.cpu_count() or 1
+        if workers == 1 or len(items) < _PARALLEL_VERIFY_THRESHOLD:
+            return _verify_chunk(items)
+
+        chunk_size = -(-len(items) // workers)
+        chunks = [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+        results = []
+        for chunk_results in _get_verify_pool(workers).map(_verify_chunk, chunks):
+            results.extend(chunk_results)
+        return results
@@ -1,18 +1,55 @@
 import os
 import json
-import base64
-from nacl.signing import SigningKey
-from nacl.encoding import Base64Encoder
+import tempfile
+from typing import TYPE_CHECKING
 from fontana.core.config import config
 
+if TYPE_CHECKING:
+    # nacl loads libsodium, so it is imported where keys are created instead
+    from nacl.signing import SigningKey
+
+try:
+    import pybase64 as _b64
+except ImportError:  # pybase64 is an optional speedup
+    import base64 as _b64
+
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:  # orjson is an optional speedup
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+    _json_loads = json.loads
+
+# Length of an Ed25519 signature
+_SIGNATURE_BYTES = 64
+
+# Directories save() has already created, so repeat saves skip makedirs
+_ensured_dirs = set()
+
 
 class Wallet:
-    def __init__(self, signing_key: SigningKey):
+    def __init__(self, signing_key: "SigningKey"):
         self.signing_key = signing_key
         self.verify_key = signing_key.verify_key
+        # The address never changes for a given key, so encode it once
+        self._address = _b64.b64encode(self.verify_key.encode()).decode("ascii")
+
+        # Keep libsodium's expanded secret key so sign() can call crypto_sign
+        # directly instead of going through SigningKey.sign and SignedMessage
+        from nacl.bindings import crypto_sign, crypto_sign_seed_keypair
+
+        _, self._secret_key = crypto_sign_seed_keypair(signing_key.encode())
+        self._crypto_sign = crypto_sign
 
     @classmethod
     def generate(cls) -> "Wallet":
+        from nacl.signing import SigningKey
+
         key = SigningKey.generate()
         return cls(key)
 
@@ -20,27 +57,49 @@ class Wallet:
     def load(cls, path: str = None) -> "Wallet":
         if path is None:
             path = str(config.wallet_path)
-        with open(path, "r") as f:
-            data = json.load(f)
-        key_bytes = base64.b64decode(data["private_key"])
+        with open(path, "rb") as f:
+            data = _json_loads(f.read())
+        key_bytes = _b64.b64decode(data["private_key"], validate=True)
+
+        from nacl.signing import SigningKey
+
         return cls(SigningKey(key_bytes))
 
     def save(self, path: str = None):
         if path is None:
             path = str(config.wallet_path)
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w") as f:
-            json.dump(
-                {
-                    "private_key": base64.b64encode(self.signing_key.encode()).decode(
-                        "utf-8"
-                    )
-                },
-                f,
-            )
+        directory = os.path.dirname(path)
+        if directory and directory not in _ensured_dirs:
+            os.makedirs(directory, exist_ok=True)
+            _ensured_dirs.add(directory)
+        private_key = _b64.b64encode(self.signing_key.encode()).decode("ascii")
+
+        # mkstemp creates a new file that only the owner can read, which
+        # matters because wallet files hold the private key
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=directory or ".", suffix=".tmp")
+        except FileNotFoundError:
+            if not directory:
+                raise
+            # The directory was removed after we created it
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_json_dumps({"private_key": private_key}))
+                f.flush()
+                os.fsync(f.fileno())
+            # Swap the new file in atomically so a crash never leaves a torn key
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
 
     def get_address(self) -> str:
-        return self.verify_key.encode(encoder=Base64Encoder).decode("utf-8")
+        return self._address
 
     def sign(self, message: bytes) -> str:
         """Sign a message using the wallet's private key.
@@ -51,7 +110,6 @@ class Wallet:
         Returns:
             str: Base64-encoded signature
         """
-        # Use the Signer to sign the message
-        from fontana.wallet.signer import Signer
-
-        return Signer.sign(message=message, private_key=self.signing_key.encode())
+        # crypto_sign returns the signature followed by the message
+        signature = self._crypto_sign(message, self._secret_key)[:_SIGNATURE_BYTES]
+        return _b64.b64encode(signature).decode("ascii")
@@ -1,14 +1,69 @@
 """
 Pytest configuration for Fontana tests.
 
-This file helps pytest find and run tests correctly by setting up the Python path
-and other configuration options.
+Shared fixtures for the test suite. The Python path is set up by the
+pythonpath option in pytest.ini.
 """
 
-import os
-import sys
+import shutil
+import sqlite3
 
-# Add the project root to the Python path to help with imports
-project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
+import pytest
+
+from fontana.core.models.block import Block, BlockHeader
+
+# Schema created by scripts/vault_watcher.py
+VAULT_WATCHER_SCHEMA = """
+CREATE TABLE IF NOT EXISTS vault_deposits (
+    l1_tx_hash TEXT PRIMARY KEY,
+    recipient_address TEXT NOT NULL,
+    amount REAL NOT NULL,
+    l1_block_height INTEGER NOT NULL,
+    l1_block_time INTEGER NOT NULL,
+    processed_time INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS system_vars (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+@pytest.fixture(scope="session")
+def vault_db_template(tmp_path_factory):
+    """Build the vault watcher schema once per session; tests copy the file."""
+    path = tmp_path_factory.mktemp("vault_db") / "template.db"
+    conn = sqlite3.connect(path)
+    try:
+        conn.executescript(VAULT_WATCHER_SCHEMA)
+    finally:
+        conn.close()
+    return path
+
+
+@pytest.fixture
+def vault_db_path(vault_db_template, tmp_path):
+    """Path to a fresh copy of the vault watcher schema."""
+    path = tmp_path / "vault_watcher.db"
+    shutil.copyfile(vault_db_template, path)
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def mock_block():
+    """Create a block for testing; shared by every test, so don't modify it."""
+    header = BlockHeader(
+        height=123,
+        prev_hash="prev-hash-123",
+        state_root="state-root-123",
+        timestamp=1714489547,
+        tx_count=2,
+        fee_schedule_id="test-fee-schedule",
+        hash="block-hash-123",
+        blob_ref=""  # Add empty blob_ref to satisfy validation
+    )
+    
+    return Block(
+        header=header,
+        transactions=[]
+    )
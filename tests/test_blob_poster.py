@@ -3,20 +3,21 @@ Tests for the Blob Poster daemon.
 """
 import pytest
 import json
+import sqlite3
+import threading
 import time
 from unittest.mock import MagicMock, patch, call
 
-from fontana.core.da.poster import BlobPoster
+from fontana.core.da.poster import BlobPoster, _FETCH_SQL
 from fontana.core.da.client import CelestiaClient, CelestiaSubmissionError
-from fontana.core.models.block import Block, BlockHeader
-from fontana.core.notifications import NotificationManager, NotificationType
+from fontana.core.notifications import NotificationType
 
 
 @pytest.fixture
 def mock_notification_manager():
     """Create a mock notification manager."""
-    manager = MagicMock(spec=NotificationManager)
-    return manager
+    # The poster only calls notify(), so a spec adds nothing
+    return MagicMock()
 
 
 @pytest.fixture
@@ -27,24 +28,32 @@ def mock_celestia_client(mock_notification_manager):
     return client
 
 
+@pytest.fixture(scope="module")
+def mock_db_module():
+    """Patch the poster's database module once for every test in this file."""
+    patcher = patch('fontana.core.da.poster.db')
+    mock_db = patcher.start()
+    mock_conn = MagicMock()
+    mock_cursor = MagicMock()
+    yield mock_db, mock_conn, mock_cursor
+    patcher.stop()
+
+
 @pytest.fixture
-def mock_block():
-    """Create a mock block for testing."""
-    header = BlockHeader(
-        height=123,
-        prev_hash="prev-hash-123",
-        state_root="state-root-123",
-        timestamp=1714489547,
-        tx_count=2,
-        fee_schedule_id="test-fee-schedule",
-        hash="block-hash-123",
-        blob_ref=""  # Add empty blob_ref to satisfy validation
-    )
-    
-    return Block(
-        header=header,
-        transactions=[]
-    )
+def db_mocks(mock_db_module):
+    """Reset the shared database mocks and wire them together for one test."""
+    mock_db, mock_conn, mock_cursor = mock_db_module
+    for mock in mock_db_module:
+        mock.reset_mock(return_value=True, side_effect=True)
+    mock_db.get_connection.return_value = mock_conn
+    mock_conn.cursor.return_value = mock_cursor
+    return mock_db_module
+
+
+@pytest.fixture
+def mock_connection(db_mocks):
+    """Return the connection BlobPoster polls with."""
+    return db_mocks[1]
 
 
 @pytest.fixture
@@ -63,45 +72,59 @@ def blob_poster(mock_celestia_client, mock_notification_manager):
 class TestBlobPoster:
     """Tests for the BlobPoster class."""
     
-    @patch('fontana.core.da.poster.db')
-    def test_fetch_uncommitted_blocks(self, mock_db, blob_poster, mock_block):
+    def test_fetch_uncommitted_blocks(self, db_mocks, mock_connection, blob_poster, mock_block):
         """Test fetching uncommitted blocks from the database."""
-        # Set up mock cursor
-        mock_cursor = MagicMock()
-        mock_conn = MagicMock()
-        mock_conn.cursor.return_value = mock_cursor
-        mock_db.get_connection.return_value = mock_conn
-        
-        # Set up cursor to return a serialized block
-        mock_cursor.fetchall.return_value = [(json.dumps(mock_block.model_dump()),)]
+        # Set up the connection to return a serialized block
+        mock_connection.execute.return_value.fetchall.return_value = [
+            (json.dumps(mock_block.model_dump()),)
+        ]
         
-        # Call the method
+        # Call the method twice
         blocks = blob_poster.fetch_uncommitted_blocks()
+        blob_poster.fetch_uncommitted_blocks()
         
-        # Verify the SQL query
-        mock_cursor.execute.assert_called_with("""
-                SELECT json 
-                FROM blocks 
-                WHERE committed = 0
-                ORDER BY height ASC
-            """)
+        # Verify the shared SQL query was used
+        mock_connection.execute.assert_called_with(_FETCH_SQL)
         
-        # Verify connection was closed
-        mock_conn.close.assert_called_once()
+        # Verify one connection is opened and kept open between polls
+        db_mocks[0].get_connection.assert_called_once_with(check_same_thread=False)
+        mock_connection.close.assert_not_called()
         
         # Verify blocks returned
         assert len(blocks) == 1
         assert blocks[0].header.height == mock_block.header.height
         assert blocks[0].header.hash == mock_block.header.hash
     
-    @patch('fontana.core.da.poster.db')
-    def test_mark_block_committed(self, mock_db, blob_poster):
+    def test_fetch_uncommitted_blocks_across_threads(self, db_mocks, blob_poster, mock_block):
+        """Test that the poll thread can reuse a connection opened by a direct call."""
+        def open_db(**kwargs):
+            conn = sqlite3.connect(":memory:", **kwargs)
+            conn.execute("CREATE TABLE blocks (height INTEGER, json TEXT, committed INTEGER)")
+            conn.execute(
+                "INSERT INTO blocks VALUES (?, ?, 0)",
+                (mock_block.header.height, mock_block.model_dump_json()),
+            )
+            return conn
+        db_mocks[0].get_connection.side_effect = open_db
+        
+        # First fetch opens the connection on this thread
+        assert len(blob_poster.fetch_uncommitted_blocks()) == 1
+        
+        # Fetch again from another thread, as the poll loop does
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.append(blob_poster.fetch_uncommitted_blocks())
+        )
+        thread.start()
+        thread.join()
+        
+        assert len(results[0]) == 1
+        db_mocks[0].get_connection.assert_called_once()
+        blob_poster._close_connection()
+    
+    def test_mark_block_committed(self, db_mocks, blob_poster):
         """Test marking a block as committed in the database."""
-        # Set up mock cursor
-        mock_cursor = MagicMock()
-        mock_conn = MagicMock()
-        mock_conn.cursor.return_value = mock_cursor
-        mock_db.get_connection.return_value = mock_conn
+        mock_db, mock_conn, mock_cursor = db_mocks
         
         # Set up cursor to indicate success (1 row updated)
         mock_cursor.rowcount = 1
@@ -186,8 +209,7 @@ class TestBlobPoster:
         # Verify the block was added to the retry queue
         assert mock_block.header.height in blob_poster.retry_queue
     
-    @patch('fontana.core.da.poster.db')
-    def test_process_block_success(self, mock_db, blob_poster, mock_block, mock_celestia_client):
+    def test_process_block_success(self, db_mocks, blob_poster, mock_block, mock_celestia_client):
         """Test processing a block successfully."""
         # Set up mocks
         mock_celestia_client.post_block.return_value = "test-blob-ref"
@@ -206,8 +228,7 @@ class TestBlobPoster:
             # Verify success
             assert result is True
     
-    @patch('fontana.core.da.poster.db')
-    def test_process_block_failure(self, mock_db, blob_poster, mock_block, mock_celestia_client):
+    def test_process_block_failure(self, db_mocks, blob_poster, mock_block, mock_celestia_client):
         """Test processing a block with Celestia submission failure."""
         # Set up mock to fail
         mock_celestia_client.post_block.side_effect = CelestiaSubmissionError("Failed")
@@ -246,17 +267,10 @@ class TestBlobPoster:
             # Verify block was removed from retry queue
             assert 123 not in blob_poster.retry_queue
     
-    @patch('fontana.core.da.poster.db')
-    def test_run_integration(self, mock_db, blob_poster, mock_block, mock_celestia_client):
+    def test_run_integration(self, mock_connection, blob_poster, mock_block, mock_celestia_client):
         """Test the main run loop with integration between components."""
-        # Set up mocks
-        mock_cursor = MagicMock()
-        mock_conn = MagicMock()
-        mock_conn.cursor.return_value = mock_cursor
-        mock_db.get_connection.return_value = mock_conn
-        
-        # Set up cursor to return a serialized block, then empty
-        mock_cursor.fetchall.side_effect = [
+        # Set up the connection to return a serialized block, then empty
+        mock_connection.execute.return_value.fetchall.side_effect = [
             [(json.dumps(mock_block.model_dump()),)],  # First call returns a block
             []  # Subsequent calls return empty
         ]
@@ -1,12 +1,11 @@
-import random
-import string
+import secrets
 from fontana.core.models.transaction import SignedTransaction
 from fontana.core.models.utxo import UTXO, UTXORef
 from fontana.core.models.block import Block, BlockHeader
 
 
 def make_dummy_tx() -> SignedTransaction:
-    rand = ''.join(random.choices(string.ascii_lowercase + string.digits, k=6))
+    rand = secrets.token_hex(3)
     txid = f"tx_{rand}"
     input_txid = f"input_{rand}"
 
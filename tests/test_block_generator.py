@@ -2,7 +2,10 @@
 Tests for the block generator.
 """
 import pytest
+import json
+import threading
 import time
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock, call
 
 from fontana.core.models.transaction import SignedTransaction
@@ -12,11 +15,25 @@ from fontana.core.block_generator.processor import TransactionProcessor
 from fontana.core.block_generator.generator import BlockGenerator, BlockGenerationError
 
 
+def make_tx(txid: str, sender: str) -> SignedTransaction:
+    """Create a transaction stub without validation or mock overhead."""
+    return SignedTransaction.model_construct(
+        txid=txid,
+        sender_address=sender,
+        inputs=[],
+        outputs=[],
+        fee=0.01,
+        payload_hash="",
+        timestamp=0,
+        signature=""
+    )
+
+
 @pytest.fixture
 def mock_ledger():
     """Create a mock ledger for testing."""
     ledger = MagicMock(spec=Ledger)
-    ledger.apply_transaction.return_value = True
+    ledger.apply_transactions.side_effect = lambda txs, **kwargs: [True] * len(txs)
     ledger.get_current_state_root.return_value = "test-state-root"
     return ledger
 
@@ -26,33 +43,14 @@ def mock_processor():
     """Create a mock transaction processor for testing."""
     processor = MagicMock(spec=TransactionProcessor)
     
-    # Create mock transactions with all required attributes
-    tx1 = MagicMock(spec=SignedTransaction)
-    tx1.txid = "tx1"
-    tx1.sender_address = "sender1"
-    tx1.inputs = []
-    tx1.outputs = []
-    tx1.fee = 0.01
-    tx1.verify_signature = MagicMock(return_value=True)
-    
-    tx2 = MagicMock(spec=SignedTransaction)
-    tx2.txid = "tx2"
-    tx2.sender_address = "sender2"
-    tx2.inputs = []
-    tx2.outputs = []
-    tx2.fee = 0.01
-    tx2.verify_signature = MagicMock(return_value=True)
-    
-    tx3 = MagicMock(spec=SignedTransaction)
-    tx3.txid = "tx3"
-    tx3.sender_address = "sender3"
-    tx3.inputs = []
-    tx3.outputs = []
-    tx3.fee = 0.01
-    tx3.verify_signature = MagicMock(return_value=True)
+    # Create transactions with all required attributes
+    tx1 = make_tx("tx1", "sender1")
+    tx2 = make_tx("tx2", "sender2")
+    tx3 = make_tx("tx3", "sender3")
     
     # Set up processor methods
-    processor.get_pending_transactions.return_value = [tx1, tx2, tx3]
+    processor.drain_pending.return_value = [tx1, tx2, tx3]
+    processor.verify_pending.side_effect = lambda txs: list(txs)
     
     return processor
 
@@ -102,21 +100,18 @@ def test_block_generator_init(mock_ledger, mock_processor):
         assert generator.is_running is False
         assert generator.block_interval == 5
         assert generator.max_block_size == 100
+        assert generator._make_header.keywords["fee_schedule_id"] == "test-fee-schedule"
 
 
 @patch("fontana.core.block_generator.generator.time")
-@patch("fontana.core.block_generator.generator.config")
-def test_create_block_header(mock_config, mock_time, block_generator):
+def test_create_block_header(mock_time, block_generator):
     """Test creating a block header."""
     # Set up time mock
     current_time = 1714489547
     mock_time.time.return_value = current_time
     
-    # Set up config mock
-    mock_config.fee_schedule_id = "test-fee-schedule"
-    
-    # Create mock transactions
-    transactions = [MagicMock(), MagicMock()]
+    # Create transactions
+    transactions = [make_tx("tx1", "sender1"), make_tx("tx2", "sender2")]
     
     # Create a block header
     header = block_generator.create_block_header(
@@ -136,6 +131,23 @@ def test_create_block_header(mock_config, mock_time, block_generator):
     assert header.hash is not None  # Hash should be generated
 
 
+def test_create_block_header_blake3(block_generator):
+    """Test hashing block headers with BLAKE3 when configured."""
+    blake3 = pytest.importorskip("blake3")
+    
+    block_generator._block_hash_algorithm = "blake3"
+    
+    header = block_generator.create_block_header(
+        height=5,
+        prev_hash="prev-hash",
+        state_root="state-root",
+        transactions=[]
+    )
+    
+    header_json = json.dumps(header.model_dump(exclude={"hash"}), sort_keys=True)
+    assert header.hash == blake3.blake3(header_json.encode()).hexdigest()
+
+
 def test_generate_block(block_generator, mock_ledger, mock_processor, mock_db):
     """Test generating a block from pending transactions."""
     # Generate a block
@@ -149,16 +161,34 @@ def test_generate_block(block_generator, mock_ledger, mock_processor, mock_db):
     assert len(block.transactions) == 3
     
     # Verify interactions with ledger and processor
-    assert mock_ledger.apply_transaction.call_count == 3
-    mock_processor.get_pending_transactions.assert_called_once()
+    mock_ledger.apply_transactions.assert_called_once_with(
+        mock_processor.drain_pending.return_value, signatures_verified=True
+    )
+    mock_processor.drain_pending.assert_called_once_with(100)
+    mock_processor.requeue.assert_called_once_with([])
     mock_processor.clear_processed_transactions.assert_called_once_with(["tx1", "tx2", "tx3"])
-    mock_db.save_block.assert_called_once()
+    mock_db.save_blocks.assert_called_once_with([block])
+
+
+def test_generate_block_skips_invalid_signatures(block_generator, mock_ledger, mock_processor, mock_db):
+    """Test that transactions failing signature verification are not applied."""
+    # Reject the signature of the second transaction
+    mock_processor.verify_pending.side_effect = lambda txs: [
+        tx for tx in txs if tx.txid != "tx2"
+    ]
+    
+    block = block_generator.generate_block()
+    
+    assert [tx.txid for tx in block.transactions] == ["tx1", "tx3"]
+    mock_ledger.apply_transactions.assert_called_once_with(
+        block.transactions, signatures_verified=True
+    )
 
 
 def test_generate_block_no_transactions(block_generator, mock_processor):
     """Test generating a block with no pending transactions."""
     # Set up processor to return empty list
-    mock_processor.get_pending_transactions.return_value = []
+    mock_processor.drain_pending.return_value = []
     
     # Generate a block
     block = block_generator.generate_block()
@@ -170,13 +200,52 @@ def test_generate_block_no_transactions(block_generator, mock_processor):
 def test_generate_block_failed_transactions(block_generator, mock_ledger, mock_processor):
     """Test generating a block with transactions that fail to apply."""
     # Set up ledger to reject all transactions
-    mock_ledger.apply_transaction.return_value = False
+    mock_ledger.apply_transactions.side_effect = lambda txs, **kwargs: [False] * len(txs)
     
     # Generate a block
     block = block_generator.generate_block()
     
     # Verify no block was generated
     assert block is None
+    
+    # Verify the transactions went back on the queue
+    mock_processor.requeue.assert_called_once_with(mock_processor.drain_pending.return_value)
+
+
+def test_generate_block_save_failure_requeues(block_generator, mock_processor, mock_db):
+    """Test that applied transactions go back on the queue if the block is not saved."""
+    mock_db.save_blocks.side_effect = Exception("disk full")
+    
+    block = block_generator.generate_block()
+    
+    assert block is not None
+    mock_processor.requeue.assert_called_with(mock_processor.drain_pending.return_value)
+    mock_processor.clear_processed_transactions.assert_not_called()
+
+
+def test_generate_block_error_requeues(block_generator, mock_ledger, mock_processor, mock_db):
+    """Test that drained transactions go back on the queue if generation fails."""
+    mock_ledger.get_current_state_root.side_effect = Exception("tree error")
+    
+    with pytest.raises(BlockGenerationError):
+        block_generator.generate_block()
+    
+    mock_processor.requeue.assert_called_with(mock_processor.drain_pending.return_value)
+    mock_db.save_blocks.assert_not_called()
+
+
+def test_wake_interrupts_wait(block_generator, mock_processor):
+    """Test that queuing a transaction wakes the generation loop early."""
+    mock_processor.add_pending_listener.assert_called_once_with(block_generator.wake)
+    
+    waiter = threading.Thread(target=block_generator._wait, args=(30,))
+    start = time.monotonic()
+    waiter.start()
+    while waiter.is_alive() and time.monotonic() - start < 5:
+        block_generator.wake()
+        waiter.join(0.01)
+    
+    assert not waiter.is_alive()
 
 
 @patch("fontana.core.block_generator.generator.threading.Thread")
@@ -199,18 +268,18 @@ def test_start_stop(mock_thread, block_generator):
 @patch("fontana.core.block_generator.generator.time")
 def test_block_generation_loop(mock_time, block_generator):
     """Test the block generation loop behavior."""
-    # Create test transaction mocks that we'll use
-    mock_tx1 = MagicMock()
-    mock_tx2 = MagicMock()
+    # Create test transactions that we'll use
+    mock_tx1 = make_tx("tx1", "sender1")
+    mock_tx2 = make_tx("tx2", "sender2")
     
-    # Create a mock block for the generate_block method to return
-    mock_block = MagicMock()
-    mock_block.header.height = 123
-    mock_block.transactions = [mock_tx1, mock_tx2]
+    # Create a stand-in block for the generate_block method to return
+    mock_block = SimpleNamespace(
+        header=SimpleNamespace(height=123), transactions=[mock_tx1, mock_tx2]
+    )
     
     # Set up time mock to handle time comparisons correctly
-    current_time = 1000
-    mock_time.time.return_value = current_time
+    current_ns = 1000 * 1_000_000_000
+    mock_time.monotonic_ns.return_value = current_ns
     
     # Override the generate_block method with a mock
     original_method = block_generator.generate_block
@@ -218,12 +287,12 @@ def test_block_generation_loop(mock_time, block_generator):
     
     # Set up the generator for testing
     block_generator.is_running = True
-    block_generator.last_batch_time = 0  # Set this to zero to force a time delta
+    block_generator.last_batch_ns = 0  # Set this to zero to force a time delta
     
     # Setup transaction processor with pending transactions
     block_generator.processor.pending_transactions = [mock_tx1, mock_tx2]
-    block_generator.processor.get_transaction_stats = MagicMock(return_value={"count": 10})
-    block_generator.processor.get_pending_transactions = MagicMock(return_value=[mock_tx1, mock_tx2])
+    block_generator.processor.get_transaction_stats.return_value = {"count": 10}
+    block_generator.processor.get_pending_transactions.return_value = [mock_tx1, mock_tx2]
     block_generator.processor.clear_processed_transactions = MagicMock()
     
     # Force a large enough time difference to trigger block generation
@@ -241,7 +310,7 @@ def test_block_generation_loop(mock_time, block_generator):
             if new_block and new_block.transactions:
                 applied_tx_ids = [tx.txid for tx in new_block.transactions]
                 block_generator.processor.clear_processed_transactions(applied_tx_ids)
-                block_generator.last_batch_time = current_time
+                block_generator.last_batch_ns = current_ns
     
     # Execute our simplified loop once
     mock_block_loop()
@@ -250,7 +319,7 @@ def test_block_generation_loop(mock_time, block_generator):
     block_generator.generate_block.assert_called_once()
     
     # Verify the transaction processor's clear_processed_transactions was called
-    block_generator.processor.clear_processed_transactions.assert_called_once()
+    block_generator.processor.clear_processed_transactions.assert_called_once_with(["tx1", "tx2"])
     
     # Restore the original method
     block_generator.generate_block = original_method
@@ -9,6 +9,10 @@ from fontana.core.ledger.ledger import Ledger
 from fontana.core.notifications import NotificationType
 
 
+# Run together on one worker under `pytest -n auto --dist loadgroup`
+pytestmark = pytest.mark.xdist_group("bridge")
+
+
 @pytest.fixture
 def mock_ledger():
     """Create a mock ledger."""
@@ -3,7 +3,6 @@ Integration tests for the bridge interface and vault watcher.
 """
 import pytest
 import time
-import tempfile
 import sqlite3
 import logging
 from unittest.mock import MagicMock, patch, ANY
@@ -14,6 +13,10 @@ from fontana.core.notifications import NotificationType, NotificationManager
 from scripts.vault_watcher import VaultWatcher
 
 
+# Run together on one worker under `pytest -n auto --dist loadgroup`
+pytestmark = pytest.mark.xdist_group("bridge")
+
+
 @pytest.fixture
 def mock_ledger():
     """Create a mock ledger."""
@@ -30,15 +33,8 @@ def mock_notification_manager():
         yield mock_nm
 
 
-@pytest.fixture
-def temp_db_path():
-    """Create a temporary database file."""
-    with tempfile.NamedTemporaryFile(suffix='.db') as f:
-        yield f.name
-
-
 @patch('scripts.vault_watcher.handle_deposit_received')
-def test_deposit_flow_from_l1_to_ledger(mock_bridge_handler, mock_ledger, temp_db_path):
+def test_deposit_flow_from_l1_to_ledger(mock_bridge_handler, mock_ledger, vault_db_path):
     """
     Test the full flow from L1 deposit detection to ledger processing.
 
@@ -51,34 +47,13 @@ def test_deposit_flow_from_l1_to_ledger(mock_bridge_handler, mock_ledger, temp_d
     # Set up the mock handler
     mock_bridge_handler.return_value = True
     
-    # Set up the database
-    with sqlite3.connect(temp_db_path) as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS vault_deposits (
-            l1_tx_hash TEXT PRIMARY KEY,
-            recipient_address TEXT NOT NULL,
-            amount REAL NOT NULL,
-            l1_block_height INTEGER NOT NULL,
-            l1_block_time INTEGER NOT NULL,
-            processed_time INTEGER NOT NULL
-        )
-        """)
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS system_vars (
-            key TEXT PRIMARY KEY,
-            value TEXT NOT NULL
-        )
-        """)
-        conn.commit()
-    
     # Create a vault watcher instance
     watcher = VaultWatcher(
         vault_address="celestia1abc123def456",
         l1_node_url="",  # Empty URL will use mock implementation
         ledger=mock_ledger,
         poll_interval=1,
-        db_path=temp_db_path
+        db_path=vault_db_path
     )
     
     # Test deposit data
@@ -100,7 +75,7 @@ def test_deposit_flow_from_l1_to_ledger(mock_bridge_handler, mock_ledger, temp_d
     mock_bridge_handler.assert_called_once_with(test_deposit, mock_ledger)
     
     # Verify the deposit was recorded in the database
-    with sqlite3.connect(temp_db_path) as conn:
+    with sqlite3.connect(vault_db_path) as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM vault_deposits WHERE l1_tx_hash = ?", ("test_tx_123",))
         count = cursor.fetchone()[0]
@@ -108,7 +83,7 @@ def test_deposit_flow_from_l1_to_ledger(mock_bridge_handler, mock_ledger, temp_d
 
 
 @patch('fontana.bridge.celestia.account_client.CelestiaAccountClient')
-def test_vault_watcher_initialization(mock_celestia_client, mock_ledger, temp_db_path):
+def test_vault_watcher_initialization(mock_celestia_client, mock_ledger, vault_db_path):
     """Test that the vault watcher initializes correctly with the right dependencies."""
     # Create mock Celestia client
     mock_client_instance = MagicMock()
@@ -120,7 +95,7 @@ def test_vault_watcher_initialization(mock_celestia_client, mock_ledger, temp_db
         l1_node_url="http://celestia-node:26657",
         ledger=mock_ledger,
         poll_interval=10,
-        db_path=temp_db_path
+        db_path=vault_db_path
     )
     
     # Verify the watcher was initialized correctly
@@ -135,7 +110,7 @@ def test_vault_watcher_initialization(mock_celestia_client, mock_ledger, temp_db
 @patch('scripts.vault_watcher.handle_deposit_received')
 @patch('threading.Thread')
 @patch('fontana.bridge.celestia.account_client.CelestiaAccountClient')
-def test_simulated_vault_watcher_run(mock_client_class, mock_thread, mock_bridge_handler, mock_ledger, temp_db_path):
+def test_simulated_vault_watcher_run(mock_client_class, mock_thread, mock_bridge_handler, mock_ledger, vault_db_path):
     """
     Test a simulated run of the vault watcher daemon.
 
@@ -153,6 +128,13 @@ def test_simulated_vault_watcher_run(mock_client_class, mock_thread, mock_bridge
     mock_client = MagicMock()
     mock_client.get_current_height.return_value = 1030
     mock_client.get_deposits_since_height.return_value = [
+        {
+            "l1_tx_hash": "test_tx_0",
+            "recipient_address": "fontana1xyz",
+            "amount": 5.0,
+            "l1_block_height": 1005,
+            "l1_block_time": int(time.time())
+        },
         {
             "l1_tx_hash": "test_tx_1",
             "recipient_address": "fontana1abc",
@@ -170,28 +152,21 @@ def test_simulated_vault_watcher_run(mock_client_class, mock_thread, mock_bridge
     ]
     mock_client_class.return_value = mock_client
     
-    # Set up the database
-    with sqlite3.connect(temp_db_path) as conn:
+    # Seed the database
+    with sqlite3.connect(vault_db_path) as conn:
         cursor = conn.cursor()
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS vault_deposits (
-            l1_tx_hash TEXT PRIMARY KEY,
-            recipient_address TEXT NOT NULL,
-            amount REAL NOT NULL,
-            l1_block_height INTEGER NOT NULL,
-            l1_block_time INTEGER NOT NULL,
-            processed_time INTEGER NOT NULL
-        )
-        """)
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS system_vars (
-            key TEXT PRIMARY KEY,
-            value TEXT NOT NULL
-        )
-        """)
         cursor.execute(
             "INSERT INTO system_vars (key, value) VALUES ('last_l1_height_processed', '1000')"
         )
+        # A deposit recorded by an earlier run
+        cursor.execute(
+            """
+            INSERT INTO vault_deposits
+            (l1_tx_hash, recipient_address, amount, l1_block_height, l1_block_time, processed_time)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            ("test_tx_0", "fontana1xyz", 5.0, 1005, int(time.time()), int(time.time()))
+        )
         conn.commit()
     
     # Create a vault watcher instance
@@ -200,7 +175,7 @@ def test_simulated_vault_watcher_run(mock_client_class, mock_thread, mock_bridge
         l1_node_url="http://celestia-node:1317",  # Provide a URL to use the client
         ledger=mock_ledger,
         poll_interval=1,
-        db_path=temp_db_path
+        db_path=vault_db_path
     )
     
     # Replace the actual client with our mock
@@ -212,21 +187,25 @@ def test_simulated_vault_watcher_run(mock_client_class, mock_thread, mock_bridge
     deposits = watcher._get_deposits_in_range(last_height + 1, current_height)
     
     # Verify we got the expected deposits
-    assert len(deposits) == 2
+    assert len(deposits) == 3
+    
+    # The deposit recorded earlier is filtered out
+    unprocessed = watcher._filter_unprocessed(deposits)
+    assert [d["l1_tx_hash"] for d in unprocessed] == ["test_tx_1", "test_tx_2"]
     
-    # Process each deposit
-    for deposit in deposits:
-        watcher._process_deposit(deposit)
+    # Process the batch of deposits
+    results = watcher._process_deposits(deposits)
+    assert results == [True, True, True]
     
-    # Verify that the bridge handler was called for each deposit
+    # Verify that the bridge handler was called for each new deposit
     assert mock_bridge_handler.call_count == 2
     
     # Verify the deposits were recorded in the database
-    with sqlite3.connect(temp_db_path) as conn:
+    with sqlite3.connect(vault_db_path) as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM vault_deposits")
         count = cursor.fetchone()[0]
-        assert count == 2
+        assert count == 3
 
 
 def test_bridge_handler_ledger_integration(mock_ledger, mock_notification_manager):
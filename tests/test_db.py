@@ -0,0 +1,93 @@
+"""
+Tests for the database module.
+"""
+import sqlite3
+
+import pytest
+from unittest.mock import patch
+
+from fontana.core.db import db
+from fontana.core.models.block import Block, BlockHeader
+from fontana.core.models.transaction import SignedTransaction
+
+
+@pytest.fixture
+def temp_db(tmp_path):
+    """Point the database module at a fresh database file."""
+    db_path = tmp_path / "ledger.db"
+    with patch.object(db.config, "db_path", db_path):
+        db.init_db()
+        yield db_path
+
+
+def make_block(height: int, txids: list) -> Block:
+    """Create a block holding stub transactions."""
+    transactions = [
+        SignedTransaction.model_construct(
+            txid=txid,
+            sender_address="sender",
+            inputs=[],
+            outputs=[],
+            fee=0.01,
+            payload_hash="",
+            timestamp=0,
+            signature="",
+        )
+        for txid in txids
+    ]
+    header = BlockHeader(
+        height=height,
+        prev_hash=f"hash-{height - 1}",
+        state_root="state-root",
+        timestamp=0,
+        tx_count=len(transactions),
+        blob_ref="",
+        fee_schedule_id="default",
+        hash=f"hash-{height}",
+    )
+    return Block(header=header, transactions=transactions)
+
+
+def test_save_blocks(temp_db):
+    """Test saving several blocks in one call."""
+    with sqlite3.connect(temp_db) as conn:
+        conn.executemany(
+            "INSERT INTO transactions (txid, block_height) VALUES (?, NULL)",
+            [("tx1",), ("tx2",), ("tx3",)],
+        )
+
+    blocks = [make_block(1, ["tx1", "tx2"]), make_block(2, ["tx3"])]
+    assert db.save_blocks(blocks) is True
+
+    with sqlite3.connect(temp_db) as conn:
+        heights = [row[0] for row in conn.execute("SELECT height FROM blocks ORDER BY height")]
+        tx_heights = dict(conn.execute("SELECT txid, block_height FROM transactions"))
+    assert heights == [1, 2]
+    assert tx_heights == {"tx1": 1, "tx2": 1, "tx3": 2}
+
+    # Saving an existing block again leaves it untouched
+    assert db.save_block(make_block(2, ["tx3"])) is True
+
+
+def test_save_blocks_concurrent_insert(temp_db):
+    """Test that a height taken by another writer does not drop the batch."""
+    with sqlite3.connect(temp_db) as conn:
+        conn.executemany(
+            "INSERT INTO transactions (txid, block_height) VALUES (?, NULL)",
+            [("tx1",), ("tx2",)],
+        )
+        # Simulate another writer inserting height 2 after the existence check
+        conn.execute(
+            "CREATE TRIGGER race BEFORE INSERT ON blocks WHEN NEW.height = 2 "
+            "BEGIN INSERT INTO blocks (height, header_json) VALUES (2, 'other'); END"
+        )
+
+    blocks = [make_block(1, ["tx1"]), make_block(2, ["tx2"])]
+    assert db.save_blocks(blocks) is False
+
+    with sqlite3.connect(temp_db) as conn:
+        headers = dict(conn.execute("SELECT height, header_json FROM blocks"))
+        tx_heights = dict(conn.execute("SELECT txid, block_height FROM transactions"))
+    assert set(headers) == {1, 2}
+    assert headers[2] == "other"
+    assert tx_heights == {"tx1": 1, "tx2": None}
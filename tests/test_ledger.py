@@ -80,11 +80,11 @@ def mock_db():
         mock_cursor.fetchone.return_value = None  # Empty by default
         
         # Mock specific DB functions used in the Ledger
-        mock_db.get_utxo = MagicMock(return_value=None)  # Default to no UTXOs
+        mock_db.get_utxo.return_value = None  # Default to no UTXOs
         mock_db.insert_transaction = MagicMock()
         mock_db.insert_utxo = MagicMock()
         mock_db.mark_utxo_spent = MagicMock()
-        mock_db.dict_from_row = MagicMock(return_value={})
+        mock_db.dict_from_row.return_value = {}
         
         yield mock_db
 
@@ -153,6 +153,27 @@ def test_validate_signature(mock_verify, mock_db, mock_tree, test_wallets):
     mock_verify.assert_called_once()
 
 
+def test_verify_signatures(mock_db, mock_tree, test_wallets):
+    """Test validating several transaction signatures at once."""
+    ledger = Ledger()
+    sender = test_wallets["sender"]
+    recipient = test_wallets["recipient"]
+    
+    utxo_output = create_mock_utxo(
+        txid="new-txid",
+        output_index=0,
+        recipient=recipient.get_address(),
+        amount=1.0
+    )
+    good_tx = create_mock_tx([UTXORef(txid="good", output_index=0)], [utxo_output], sender, sign=False)
+    good_tx.signature = sender.sign(ledger._signing_message(good_tx))
+    bad_tx = create_mock_tx([UTXORef(txid="bad", output_index=0)], [utxo_output], sender, sign=False)
+    bad_tx.signature = recipient.sign(ledger._signing_message(bad_tx))
+    
+    assert ledger.verify_signatures([good_tx, bad_tx]) == [True, False]
+    assert ledger._validate_signature(good_tx)
+
+
 def test_check_inputs_spendable(mock_db, mock_tree, test_wallets):
     """Test checking if inputs are spendable."""
     # Setup
@@ -357,6 +378,37 @@ def test_apply_transaction(mock_db, mock_verify, mock_celestia_client_class, moc
             ledger.apply_transaction(tx)
 
 
+def test_apply_transactions(mock_db, mock_tree, test_wallets):
+    """Test applying a batch where one transaction fails validation."""
+    ledger = Ledger()
+    sender = test_wallets["sender"]
+    recipient = test_wallets["recipient"]
+    
+    utxo_output = create_mock_utxo(
+        txid="new-txid",
+        output_index=0,
+        recipient=recipient.get_address(),
+        amount=1.0
+    )
+    good_tx = create_mock_tx([UTXORef(txid="good", output_index=0)], [utxo_output], sender)
+    bad_tx = create_mock_tx([UTXORef(txid="bad", output_index=0)], [utxo_output], sender)
+    
+    with patch.object(ledger, "_check_inputs_spendable", side_effect=[[], InputNotFoundError("missing")]), \
+         patch.object(ledger, "_check_sufficient_funds"), \
+         patch.object(ledger, "_write_transaction", return_value=[("good:0", None)]):
+        results = ledger.apply_transactions([good_tx, bad_tx], signatures_verified=True)
+    
+    assert results == [True, False]
+    
+    # One database transaction, with only the failed transaction rolled back
+    connection = mock_db.get_connection.return_value
+    connection.commit.assert_called_once()
+    connection.cursor.return_value.execute.assert_any_call("ROLLBACK TO apply_tx")
+    
+    # The state tree is updated once, for the applied transaction only
+    mock_tree.update_batch.assert_called_with([("good:0", None)])
+
+
 def test_get_current_state_root(mock_db, mock_tree):
     """Test getting the current state root."""
     # Setup
@@ -1,3 +1,5 @@
+import pytest
+from fontana.core.config import config
 from fontana.wallet.wallet import Wallet
 from fontana.wallet.signer import Signer
 
@@ -22,4 +24,37 @@ def test_verify_fails_on_wrong_key():
     wallet_2 = Wallet.generate()
     message = b"important message"
     signature = Signer.sign(message, wallet_1.signing_key.encode())
-    assert Signer.verify(message, signature, wallet_2.verify_key.encode()) is False
\ No newline at end of file
+    assert Signer.verify(message, signature, wallet_2.verify_key.encode()) is False
+
+
+def test_verify_batch_reports_each_signature(monkeypatch):
+    # Force the threaded path regardless of the machine's CPU count
+    monkeypatch.setattr("fontana.wallet.signer._PARALLEL_VERIFY_THRESHOLD", 1)
+    monkeypatch.setattr("fontana.wallet.signer.os.cpu_count", lambda: 4)
+    wallets = [Wallet.generate() for _ in range(10)]
+    messages = [f"message {i}".encode() for i in range(10)]
+    signatures = [
+        Signer.sign(m, w.signing_key.encode()) for m, w in zip(messages, wallets)
+    ]
+    public_keys = [w.verify_key.encode() for w in wallets]
+
+    # Tamper with one message
+    messages[3] = b"tampered"
+
+    results = Signer.verify_batch(messages, signatures, public_keys)
+    assert results == [i != 3 for i in range(10)]
+
+
+def test_cryptography_backend_matches_pynacl(monkeypatch):
+    pytest.importorskip("cryptography")
+    wallet = Wallet.generate()
+    message = b"backend message"
+    nacl_signature = Signer.sign(message, wallet.signing_key.encode())
+
+    monkeypatch.setattr(config, "crypto_backend", "cryptography")
+    signature = Signer.sign(message, wallet.signing_key.encode())
+
+    # Ed25519 signatures are deterministic, so both backends agree
+    assert signature == nacl_signature
+    assert Signer.verify(message, signature, wallet.verify_key.encode()) is True
+    assert Signer.verify(b"other", signature, wallet.verify_key.encode()) is False
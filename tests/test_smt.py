@@ -117,6 +117,51 @@ def test_smt_generate_verify_proof():
     assert not tree.verify_proof("key2", "value2", proof, new_root)
 
 
+def test_smt_verify_proof_after_delete():
+    """Test that proofs for remaining keys verify after another key is deleted."""
+    tree = SparseMerkleTree()
+
+    # Add enough leaves that several paths share ancestors
+    for i in range(20):
+        tree.update(f"key{i}", f"value{i}")
+
+    # Delete some of them
+    for i in range(0, 20, 3):
+        tree.update(f"key{i}", None)
+
+    root = tree.get_root()
+
+    # Every remaining key should produce a proof against the current root
+    for key in tree.get_all_keys():
+        value = f"value{key[3:]}"
+        proof = tree.generate_proof(key)
+        assert tree.verify_proof(key, value, proof, root)
+        assert not tree.verify_proof(key, "wrong-value", proof, root)
+
+
+def test_smt_update_batch_matches_single_updates():
+    """Test that a batch update produces the same tree as individual updates."""
+    items = [(f"key{i}", f"value{i}") for i in range(50)]
+    items += [(f"key{i}", None) for i in range(0, 50, 4)]
+
+    single = SparseMerkleTree()
+    for key, value in items:
+        single.update(key, value)
+
+    batch = SparseMerkleTree()
+    batch.update_batch(items)
+
+    assert batch.get_root() == single.get_root()
+
+    # A tree holding only the surviving items ends up with the same root
+    survivors = SparseMerkleTree()
+    for key in sorted(single.get_all_keys()):
+        survivors.update(key, f"value{key[3:]}")
+    assert batch.get_root() == survivors.get_root()
+    assert batch.get_all_keys() == single.get_all_keys()
+    assert batch.generate_proof("key5") == single.generate_proof("key5")
+
+
 def test_smt_proof_for_nonexistent_key():
     """Test generating a proof for a nonexistent key."""
     tree = SparseMerkleTree()
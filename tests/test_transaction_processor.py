@@ -23,7 +23,7 @@ def mock_ledger():
     ledger.apply_transaction.return_value = True
     
     # Add _validate_signature method for fast validation
-    ledger._validate_signature = MagicMock(return_value=True)
+    ledger._validate_signature.return_value = True
     
     return ledger
 
@@ -203,13 +203,35 @@ def test_get_pending_transactions_with_limit(mock_verify, processor, test_transa
     assert transactions[0] == test_transaction
 
 
+def test_drain_pending(processor, test_transaction):
+    """Test taking transactions off the queue and requeuing them."""
+    tx2 = test_transaction.model_copy(update={"txid": "tx2"})
+    tx3 = test_transaction.model_copy(update={"txid": "tx3"})
+    processor.pending_transactions = [test_transaction, tx2, tx3]
+    processor.processed_txids["tx2"] = {"status": "accepted"}
+    
+    # Drain up to the limit
+    drained = processor.drain_pending(2)
+    assert drained == [test_transaction, tx2]
+    assert processor.pending_transactions == [tx3]
+    assert processor.processed_txids["tx2"]["status"] == "batched"
+    
+    # Requeued transactions go back to the front of the queue
+    processor.requeue([tx2])
+    assert processor.pending_transactions == [tx2, tx3]
+    
+    # Without a limit everything is drained
+    assert processor.drain_pending() == [tx2, tx3]
+    assert processor.pending_transactions == []
+
+
 @patch('fontana.core.models.transaction.SignedTransaction.verify_signature', return_value=True)
 def test_clear_processed_transactions(mock_verify, processor, test_transaction):
     """Test clearing processed transactions."""
     # Add some transactions
     tx1 = test_transaction
-    tx2 = MagicMock(spec=SignedTransaction, txid="tx2")
-    tx3 = MagicMock(spec=SignedTransaction, txid="tx3")
+    tx2 = test_transaction.model_copy(update={"txid": "tx2"})
+    tx3 = test_transaction.model_copy(update={"txid": "tx3"})
     processor.pending_transactions = [tx1, tx2, tx3]
     
     # Clear some transactions
@@ -220,6 +242,34 @@ def test_clear_processed_transactions(mock_verify, processor, test_transaction):
     assert processor.pending_transactions[0].txid == "tx2"
 
 
+@patch('fontana.core.models.transaction.SignedTransaction.verify_signature', return_value=True)
+def test_pending_listeners_notified(mock_verify, processor, test_transaction):
+    """Test that listeners run when a transaction is queued."""
+    listener = MagicMock()
+    processor.add_pending_listener(listener)
+    
+    processor.process_transaction_fast(test_transaction)
+    
+    assert processor.pending_transactions == [test_transaction]
+    listener.assert_called_once_with()
+
+
+def test_verify_pending(processor, test_transaction, mock_ledger):
+    """Test dropping pending transactions whose signatures fail."""
+    bad_tx = test_transaction.model_copy(update={"txid": "bad-tx-id"})
+    processor.pending_transactions = [test_transaction, bad_tx]
+    processor.processed_txids["bad-tx-id"] = {"status": "accepted"}
+    mock_ledger.verify_signatures.return_value = [True, False]
+    
+    valid = processor.verify_pending([test_transaction, bad_tx])
+    
+    # Only the valid transaction is returned and kept pending
+    assert valid == [test_transaction]
+    assert processor.pending_transactions == [test_transaction]
+    assert processor.processed_txids["bad-tx-id"]["status"] == "rejected"
+    mock_ledger.verify_signatures.assert_called_once_with([test_transaction, bad_tx])
+
+
 @patch('fontana.core.block_generator.processor.db')
 def test_get_transaction_stats_empty(mock_db, processor):
     """Test getting transaction stats with no transactions."""
@@ -241,16 +291,16 @@ def test_get_transaction_stats_empty(mock_db, processor):
 
 
 @patch('fontana.core.block_generator.processor.db')
-def test_get_transaction_stats(mock_db, processor):
+def test_get_transaction_stats(mock_db, processor, test_transaction):
     """Test getting transaction stats with transactions."""
     # Mock db.fetch_uncommitted_transactions to return an empty list (not adding additional transactions)
     mock_db.fetch_uncommitted_transactions.return_value = []
     mock_db.purge_invalid_transactions.return_value = 0
     
     # Add some transactions
-    tx1 = MagicMock(spec=SignedTransaction, txid="tx1", fee=0.01, timestamp=1000)
-    tx2 = MagicMock(spec=SignedTransaction, txid="tx2", fee=0.02, timestamp=2000)
-    tx3 = MagicMock(spec=SignedTransaction, txid="tx3", fee=0.03, timestamp=3000)
+    tx1 = test_transaction.model_copy(update={"txid": "tx1", "fee": 0.01, "timestamp": 1000})
+    tx2 = test_transaction.model_copy(update={"txid": "tx2", "fee": 0.02, "timestamp": 2000})
+    tx3 = test_transaction.model_copy(update={"txid": "tx3", "fee": 0.03, "timestamp": 3000})
     processor.pending_transactions = [tx1, tx2, tx3]
     
     # Get stats
@@ -20,3 +20,19 @@ def test_utxo_lifecycle():
 
     utxo.status = "spent"
     assert utxo.is_spent()
+
+
+def test_utxo_key_follows_reassignment():
+    utxo = UTXO(txid="pending", output_index=0, recipient="font1xyz...", amount=1.0)
+    assert utxo.key() == "pending:0"
+
+    utxo.txid = "tx789"
+    utxo.output_index = 2
+    assert utxo.key() == "tx789:2"
+    assert utxo.model_dump()["txid"] == "tx789"
+
+
+def test_utxo_key_follows_model_copy():
+    utxo = UTXO(txid="a", output_index=0, recipient="font1xyz...", amount=1.0)
+    assert utxo.key() == "a:0"
+    assert utxo.model_copy(update={"txid": "b"}).key() == "b:0"
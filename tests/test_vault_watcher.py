@@ -379,6 +379,131 @@ def test_process_deposit_new(mock_bridge_handler, mock_notification_manager, moc
         assert count == 1
 
 
+@patch('scripts.vault_watcher.handle_deposit_received')
+def test_process_deposits_single_commit(mock_bridge_handler, mock_ledger, temp_db_path):
+    """Test that a batch of deposits is recorded in one transaction."""
+    mock_bridge_handler.return_value = True
+    
+    # Initialize the watcher
+    watcher = VaultWatcher(
+        vault_address="celestia1abc123def456",
+        l1_node_url="",
+        ledger=mock_ledger,
+        poll_interval=1,
+        db_path=temp_db_path
+    )
+    
+    # Test data
+    deposits = [
+        {
+            "l1_tx_hash": f"test_tx_{i}",
+            "recipient_address": "fontana1abc123def456",
+            "amount": 10.0 * i,
+            "l1_block_height": 1000 + i,
+            "l1_block_time": 1714489547
+        }
+        for i in (1, 2)
+    ]
+    
+    # Trace every statement issued while processing the batch
+    statements = []
+    watcher._db.set_trace_callback(statements.append)
+    results = watcher._process_deposits(deposits)
+    watcher._db.set_trace_callback(None)
+    
+    # Verify the result
+    assert results == [True, True]
+    assert mock_bridge_handler.call_count == 2
+    assert [s for s in statements if s.strip().upper() == "COMMIT"] == ["COMMIT"]
+    
+    # Verify both deposits were recorded
+    with sqlite3.connect(temp_db_path) as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM vault_deposits")
+        assert cursor.fetchone()[0] == 2
+    
+    # Processing the same batch again is a no-op
+    mock_bridge_handler.reset_mock()
+    assert watcher._process_deposits(deposits) == [True, True]
+    mock_bridge_handler.assert_not_called()
+
+
+
+@patch('scripts.vault_watcher.handle_deposit_received')
+def test_process_deposits_records_only_forwarded(mock_bridge_handler, mock_ledger, temp_db_path):
+    """Test that a deposit the bridge handler rejects is not recorded."""
+    # Reject the second deposit
+    mock_bridge_handler.side_effect = [True, False]
+    
+    # Initialize the watcher
+    watcher = VaultWatcher(
+        vault_address="celestia1abc123def456",
+        l1_node_url="",
+        ledger=mock_ledger,
+        poll_interval=1,
+        db_path=temp_db_path
+    )
+    
+    # Test data
+    deposits = [
+        {
+            "l1_tx_hash": f"test_tx_{i}",
+            "recipient_address": "fontana1abc123def456",
+            "amount": 10.0 * i,
+            "l1_block_height": 1000 + i,
+            "l1_block_time": 1714489547
+        }
+        for i in (1, 2)
+    ]
+    
+    assert watcher._process_deposits(deposits) == [True, False]
+    
+    # Only the forwarded deposit was recorded
+    with sqlite3.connect(temp_db_path) as conn:
+        rows = conn.execute("SELECT l1_tx_hash FROM vault_deposits").fetchall()
+    assert rows == [("test_tx_1",)]
+    
+    # A retry forwards only the rejected deposit
+    mock_bridge_handler.reset_mock(side_effect=True)
+    mock_bridge_handler.return_value = True
+    assert watcher._process_deposits(deposits) == [True, True]
+    mock_bridge_handler.assert_called_once_with(deposits[1], mock_ledger)
+
+
+@patch('scripts.vault_watcher.handle_deposit_received', return_value=False)
+def test_run_loop_keeps_height_on_failed_deposit(mock_bridge_handler, mock_ledger, temp_db_path):
+    """Test that the loop does not skip past a deposit that failed."""
+    # Initialize the watcher
+    watcher = VaultWatcher(
+        vault_address="celestia1abc123def456",
+        l1_node_url="",
+        ledger=mock_ledger,
+        poll_interval=1,
+        db_path=temp_db_path
+    )
+    watcher.l1_client = MagicMock()
+    watcher.l1_client.get_current_height.return_value = 1010
+    watcher.l1_client.get_deposits_since_height.return_value = [
+        {
+            "l1_tx_hash": "test_tx_1",
+            "recipient_address": "fontana1abc123def456",
+            "amount": 10.0,
+            "l1_block_height": 1005,
+            "l1_block_time": 1714489547
+        }
+    ]
+    watcher._update_last_processed_height(1000)
+    
+    # Run a single pass of the loop
+    def stop_after_pass(seconds):
+        watcher.is_running = False
+    
+    watcher.is_running = True
+    with patch('scripts.vault_watcher.time.sleep', side_effect=stop_after_pass):
+        watcher._run_loop()
+    
+    mock_bridge_handler.assert_called_once()
+    assert watcher._get_last_processed_height() == 1000
 @patch('threading.Thread')
 def test_start_stop(mock_thread, mock_ledger, temp_db_path):
     """Test starting and stopping the watcher."""
@@ -409,6 +534,17 @@ def test_start_stop(mock_thread, mock_ledger, temp_db_path):
     # Verify the thread was stopped
     assert watcher.is_running is False
     mock_thread_instance.join.assert_called_once()
+    
+    # The watcher can be restarted; its database connection stays open
+    watcher.start()
+    assert watcher.is_running is True
+    watcher._db.execute("SELECT 1")
+    watcher.stop()
+    
+    # Verify close() closes the database connection
+    watcher.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        watcher._db.execute("SELECT 1")
 
 
 @patch('fontana.bridge.celestia.account_client.CelestiaAccountClient')
@@ -1,3 +1,6 @@
+import os
+import subprocess
+import sys
 import pytest
 from fontana.wallet import Wallet
 from fontana.core.config import config
@@ -12,6 +15,41 @@ def test_wallet_generate_and_save(tmp_path):
     loaded = Wallet.load(str(path))
     assert loaded.get_address() == wallet.get_address()
 
+def test_wallet_sign_matches_signing_key():
+    wallet = Wallet.generate()
+    message = b"fontana"
+    expected = wallet.signing_key.sign(message).signature
+    assert base64.b64decode(wallet.sign(message)) == expected
+
+def test_wallet_import_defers_nacl():
+    code = "import sys, fontana.wallet; sys.exit('nacl' in sys.modules)"
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    assert subprocess.run([sys.executable, "-c", code], env=env).returncode == 0
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file permissions")
+def test_wallet_save_is_owner_only(tmp_path):
+    path = tmp_path / "keys" / "wallet.json"
+    Wallet.generate().save(str(path))
+
+    assert path.stat().st_mode & 0o777 == 0o600
+    assert os.listdir(tmp_path / "keys") == ["wallet.json"]
+
+
+def test_wallet_save_failure_leaves_no_temp_file(monkeypatch, tmp_path):
+    path = tmp_path / "wallet.json"
+    path.write_text("old")
+
+    def fail_replace(src, dst):
+        raise OSError("replace failed")
+
+    monkeypatch.setattr("fontana.wallet.wallet.os.replace", fail_replace)
+    with pytest.raises(OSError):
+        Wallet.generate().save(str(path))
+
+    assert os.listdir(tmp_path) == ["wallet.json"]
+    assert path.read_text() == "old"
+
+
 def test_wallet_with_config(monkeypatch, tmp_path):
     """Test wallet using config for paths."""
     # Setup temporary path in config